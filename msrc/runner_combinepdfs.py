@@ -1,50 +1,114 @@
 from pathlib import Path
 import argparse
+import re
 from PyPDF2 import PdfReader, PdfWriter
+try:
+    import pymupdf                      # C-backed, much faster merge/select
+except ImportError:
+    pymupdf = None                      # fall back to pure-Python PyPDF2
+
+_WRITE_BUFFER = 1024 * 1024
+
+# one spec part per match: '5', '3-7' or empty (e.g. '1,,3'), followed by ',' or end
+_SPEC_RE = re.compile(r"\s*(?:(\d+)(?:\s*-\s*(\d+))?)?\s*(?:,|$)")
+
+def _iter_spans(spec: str, num_pages: int):
+    """Yield 0-based half-open (start, end) spans in spec order, clamped to the document."""
+    pos = 0
+    for m in _SPEC_RE.finditer(spec):
+        if m.start() != pos:
+            raise ValueError(f"Invalid page spec: {spec!r}")
+        pos = m.end()
+        if m[1] is None:
+            continue
+        a = int(m[1])
+        if m[2] is None:
+            if not (1 <= a <= num_pages):
+                raise ValueError(f"Page {a} out of range 1..{num_pages}")
+            yield (a - 1, a)
+            continue
+        b = int(m[2])
+        if a > b:
+            a, b = b, a
+        a = max(1, a)
+        b = min(num_pages, b)   # clamp to last page
+        if a <= b:
+            yield (a - 1, b)    # inclusive of b
 
 def parse_page_spec(spec: str, num_pages: int):
     """
     spec: 'all' | '1-end' | '1-3,5,7-9'
-    Returns 0-based page indices (sorted, unique).
+    Returns sorted, non-overlapping 0-based (start, end) intervals, end exclusive.
     """
     if not spec or spec.strip().lower() in ("all", "1-end", "end"):
-        return list(range(num_pages))
+        return [(0, num_pages)] if num_pages else []
 
-    out = set()
-    for part in spec.split(","):
-        part = part.strip()
-        if not part:
-            continue
-        if "-" in part:
-            a, b = [x.strip() for x in part.split("-", 1)]
-            a, b = int(a), int(b)
-            if a > b:
-                a, b = b, a
-            a = max(1, a)
-            b = min(num_pages, b)   # clamp to last page
-            out.update(range(a - 1, b))  # inclusive of b
+    spans = list(_iter_spans(spec, num_pages))
+    if len(spans) < 2:
+        return spans            # single page or single range: nothing to merge
+
+    # sweep-merge overlapping/adjacent spans by lower bound
+    spans.sort()
+    merged = []
+    for a, b in spans:
+        if merged and a <= merged[-1][1]:
+            if b > merged[-1][1]:
+                merged[-1] = (merged[-1][0], b)
         else:
-            i = int(part)
-            if not (1 <= i <= num_pages):
-                raise ValueError(f"Page {i} out of range 1..{num_pages}")
-            out.add(i - 1)
-    return sorted(out)
+            merged.append((a, b))
+    return merged
 
-def combine_pdfs_with_ranges(pdf_inputs, output_path):
-    writer = PdfWriter()
+def _resolve_inputs(pdf_inputs):
+    """Check every input up front; return (resolved path, page spec) pairs."""
+    resolved = []
     for item in pdf_inputs:
         path = Path(item["path"])
-        if not path.exists():
+        if not path.is_file():
             raise FileNotFoundError(f"PDF not found: {path}")
-        reader = PdfReader(str(path))
-        sel = parse_page_spec(item.get("type", "all"), len(reader.pages))
-        for p in sel:
-            writer.add_page(reader.pages[p])
+        resolved.append((str(path.resolve()), item.get("type", "all")))
+    return resolved
+
+def _combine_pymupdf(pdf_inputs, out: Path):
+    inputs = _resolve_inputs(pdf_inputs)
+    dst = pymupdf.open()
+    docs = {}                           # resolved path -> source, parsed once
+    try:
+        for path, _ in inputs:
+            if path not in docs:
+                docs[path] = pymupdf.open(path)
+        for path, spec in inputs:
+            src = docs[path]
+            for a, b in parse_page_spec(spec, len(src)):
+                dst.insert_pdf(src, from_page=a, to_page=b - 1)
+
+        out.parent.mkdir(parents=True, exist_ok=True)
+        dst.save(str(out), garbage=4, deflate=True)
+    finally:
+        for src in docs.values():
+            src.close()
+        dst.close()
+
+def _combine_pypdf2(pdf_inputs, out: Path):
+    inputs = _resolve_inputs(pdf_inputs)
+    readers = {path: PdfReader(path) for path in dict.fromkeys(p for p, _ in inputs)}
+    writer = PdfWriter()
+    for path, spec in inputs:
+        pages = readers[path].pages
+        for a, b in parse_page_spec(spec, len(pages)):
+            for p in range(a, b):
+                writer.add_page(pages[p])
 
-    out = Path(output_path)
     out.parent.mkdir(parents=True, exist_ok=True)
-    with open(out, "wb") as f:
+    # PyPDF2 issues many small writes; a 1 MiB buffer batches them into few syscalls
+    with open(out, "wb", buffering=_WRITE_BUFFER) as f:
         writer.write(f)
+
+def combine_pdfs_with_ranges(pdf_inputs, output_path):
+    out = Path(output_path)
+    if pymupdf is not None:
+        _combine_pymupdf(pdf_inputs, out)
+    else:
+        _combine_pypdf2(pdf_inputs, out)
     print(f"Combined PDF saved to: {out}")
 
 def cli_combinepdfs():
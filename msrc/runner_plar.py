@@ -1,33 +1,107 @@
-import json, os, sys, threading, subprocess, shlex, time, signal, html
-from dataclasses    import dataclass, field
+import codecs, json, os, re, sys, shlex, time, html
+from bisect         import bisect_left
+from dataclasses    import dataclass, field, replace
+from functools      import lru_cache, partial
+from io             import StringIO
+from itertools      import islice
 from typing         import Any, Dict, List, Optional
 from PySide6        import QtCore, QtGui, QtWidgets
 from PySide6.QtCore import Qt
 from pathlib        import Path
 os.environ["QT_LOGGING_RULES"] = "qt.qpa.window=false"
-from PySide6.QtWidgets import QApplication, QWidget, QVBoxLayout, QLabel, QTextEdit
 
 import warnings
 warnings.simplefilter("ignore", UserWarning)
 
+try:
+    import orjson               # optional: C-accelerated JSON, stdlib json otherwise
+except ImportError:
+    orjson = None
+
+# If bundled by PyInstaller, use the EXE folder; otherwise use project root (parent of msrc).
+# Resolved once at import: resolve() stats the filesystem and the answer never changes.
+_APP_DIR    = Path(sys.executable).parent if getattr(sys, "frozen", False) else Path(__file__).resolve().parents[1]
+_ASSET_BASE = _APP_DIR / "data" / "applogo"
+
 def APP_DIR() -> Path:
-    # If bundled by PyInstaller, use the EXE folder; otherwise use project root (parent of msrc)
-    if getattr(sys, "frozen", False):
-        return Path(sys.executable).parent
-    return Path(__file__).resolve().parents[1]
+    return _APP_DIR
 
-CONFIG_FILE = str(APP_DIR() / "msrc" / "tools_config.json")
+CONFIG_FILE = str(_APP_DIR / "msrc" / "tools_config.json")
 APP_TITLE   = "PLAR : Python Local App Runner [-_-']"
 def APP_ASSET(name: str) -> Path:
-    base = Path(sys.executable).parent if getattr(sys, "frozen", False) else APP_DIR()
-    return base / "data" / "applogo" / name
+    return _ASSET_BASE / name
 APP_ICON_FILE = ("plar.ico")
+LOG_FLUSH_MS   = 30      # at most one log append per window (~33 Hz)
+LOG_MAX_BLOCKS = 50_000  # oldest log lines are dropped beyond this
+
+# Qt constants read on every cell paint / checkable-row pass, bound once
+_CHECKED     = Qt.Checked
+_UNCHECKED   = Qt.Unchecked
+_CHECK_ROLE  = Qt.CheckStateRole
+_TEXT_ROLES  = (Qt.DisplayRole, Qt.EditRole)
+_ELIDE_RIGHT = Qt.ElideRight
+_SUMMARY_ROLES = frozenset((Qt.CheckStateRole, Qt.DisplayRole, Qt.EditRole))
+
+# interpreter used for {python}; it cannot change while we run, so check it once
+_PY_EXE    = sys.executable.replace(chr(92), chr(47))
+_PY_EXE_OK = os.path.isfile(_PY_EXE)
+
+_PLACEHOLDER_RE = re.compile(r"\{([A-Za-z_]\w*)\}")
+_ARG_RE         = re.compile(r"[^ \t\r\n]+")          # shlex's whitespace set
+_SHLEX_CHARS    = frozenset(" \t\r\n'\"\\")   # values holding these still need shlex
+
+@lru_cache(maxsize=64)
+def _compile_runner(runner: str) -> Optional[tuple]:
+    """
+    Pre-split a command template into ('lit', text) / ('ph', name) argv tokens.
+    Returns None when the template has quoting, escapes or anything but plain
+    {name} fields; those keep the format-then-shlex.split path.
+    """
+    if any(c in runner for c in "'\"\\"):
+        return None
+    tokens = []
+    for tok in _ARG_RE.findall(runner):
+        m = _PLACEHOLDER_RE.fullmatch(tok)
+        if m:
+            tokens.append(("ph", m[1]))
+        elif "{" in tok or "}" in tok:
+            return None
+        else:
+            tokens.append(("lit", tok))
+    return tuple(tokens)
+
+_ICON_CACHE: Dict[int, QtGui.QIcon] = {}
+def _std_icon(sp) -> QtGui.QIcon:
+    """QStyle standard icon, looked up once per style (cleared on theme switch)."""
+    icon = _ICON_CACHE.get(sp)
+    if icon is None:
+        icon = _ICON_CACHE[sp] = QtWidgets.QApplication.style().standardIcon(sp)
+    return icon
+
+@lru_cache(maxsize=1)
+def _mono_font() -> QtGui.QFont:
+    """Log font, resolved once: the fallback probing goes through the font system."""
+    try:
+        mono = QtGui.QFontDatabase.systemFont(QtGui.QFontDatabase.FixedFont)
+    except Exception:
+        for fam in ["Consolas", "Cascadia Mono", "Courier New", "DejaVu Sans Mono", "Menlo", "Monaco"]:
+            if QtGui.QFont(fam).exactMatch():
+                mono = QtGui.QFont(fam)
+                break
+        else:
+            mono = QtWidgets.QApplication.font()
+    mono.setPointSize(12)
+    return mono
+
+@lru_cache(maxsize=1)
+def _mono_tabstop() -> float:
+    return 4 * QtGui.QFontMetricsF(_mono_font()).horizontalAdvance(" ")
 
 # ======== class QProcRunner ==============================================================
 # =========================================================================================
 class QProcRunner(QtCore.QObject):
-    lineReady = QtCore.Signal(str)   # stdout/stderr lines
-    finished  = QtCore.Signal(int)   # exit code
+    linesReady = QtCore.Signal(list) # batch of stdout/stderr lines per read
+    finished   = QtCore.Signal(int)  # exit code
 
     def __init__(self, parent=None):
         super().__init__(parent)
@@ -35,12 +109,22 @@ class QProcRunner(QtCore.QObject):
         self.p.setProcessChannelMode(QtCore.QProcess.MergedChannels)
         self.p.readyReadStandardOutput.connect(self._on_ready)
         self.p.finished.connect(self._on_finished)
+        self._dec = codecs.getincrementaldecoder("utf-8")(errors="replace")
+        self._buf = ""                 # trailing partial line between reads
+        self._cr_pending = False       # last read ended in "\r"; a leading "\n" closes that CRLF
 
-    def start(self, cmd_list, cwd=None, env: dict | None = None):
+    def start(self, cmd_list, cwd=None, env: "dict | QtCore.QProcessEnvironment | None" = None):
+        if self.p.state() != QtCore.QProcess.NotRunning:
+            return                     # one process per runner; keep the live decoder state
         program, args = cmd_list[0], cmd_list[1:]
+        self._dec.reset()
+        self._buf = ""
+        self._cr_pending = False
         if cwd:
             self.p.setWorkingDirectory(str(cwd))
-        if env:
+        if isinstance(env, QtCore.QProcessEnvironment):
+            self.p.setProcessEnvironment(env)            # prepared by the caller, used as is
+        elif env:
             qenv = QtCore.QProcessEnvironment.systemEnvironment()
             for k, v in env.items():
                 qenv.insert(str(k), str(v))
@@ -51,20 +135,40 @@ class QProcRunner(QtCore.QObject):
         if self.p.state() != QtCore.QProcess.NotRunning:
             self.p.kill()
 
+    @QtCore.Slot()
     def _on_ready(self):
-        data = bytes(self.p.readAllStandardOutput())
-        text = data.decode(errors="replace")
-        for line in text.splitlines():
-            self.lineReady.emit(line)
-
+        data = self.p.readAllStandardOutput().data()   # already bytes, no extra copy
+        text = self._buf + self._dec.decode(data)
+        if self._cr_pending and text.startswith("\n"):
+            text = text[1:]
+        # complete lines go out; "\r" ends one too (progress bars redraw with it)
+        cut = max(text.rfind("\n"), text.rfind("\r")) + 1
+        self._buf = text[cut:]
+        self._cr_pending = text.endswith("\r")
+        if cut:
+            self.linesReady.emit(text[:cut].splitlines())
+        elif self._buf:
+            self.linesReady.emit([])   # wakes the log throttle, whose tick shows the tail
+
+    def take_partial(self) -> str:
+        """Hand out the unterminated tail read so far (prompts, progress text)."""
+        tail, self._buf = self._buf, ""
+        return tail
+
+    @QtCore.Slot(int, QtCore.QProcess.ExitStatus)
     def _on_finished(self, code, _status):
+        self._on_ready()               # drain anything still buffered in QProcess
+        tail = self._buf + self._dec.decode(b"", final=True)
+        self._buf = ""
+        if tail:
+            self.linesReady.emit(tail.splitlines())
         self.finished.emit(int(code))
 
 
 # ---------- Data Models ----------
 # ======== class InputSpec ================================================================
 # =========================================================================================
-@dataclass
+@dataclass(slots=True)
 class InputSpec:
     name: str
     type: str = "string"  # string | int | float | file | folder | enum
@@ -77,7 +181,7 @@ class InputSpec:
 
 # ======== class ToolSpec =================================================================
 # =========================================================================================
-@dataclass
+@dataclass(slots=True)
 class ToolSpec:
     name: str
     runner: str = ""                      # "pkg.mod:function" OR command template
@@ -89,6 +193,61 @@ class ToolSpec:
 # ======== MAIN ===========================================================================
 # =========================================================================================
 # ---------- Utilities ----------
+def _json_loads(data: bytes) -> Any:
+    return orjson.loads(data) if orjson else json.loads(data)
+
+def _json_dumps(obj: Any) -> bytes:
+    """Indented UTF-8 JSON bytes (same shape as json.dump(indent=2, ensure_ascii=False))."""
+    if orjson:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS)
+    return json.dumps(obj, indent=2, ensure_ascii=False).encode("utf-8")
+
+_WRITE_BUFFER = 1 << 20
+
+_SAFE_NAME_RE = re.compile(r"[^\w \-]+")    # \w = str.isalnum() plus "_", same as before
+
+@lru_cache(maxsize=128)
+def _safe_file_stem(name: str) -> str:
+    """Tool name reduced to letters, digits, space, '-' and '_' for suggested file names."""
+    return _SAFE_NAME_RE.sub("", name).strip() or "tool"
+
+def _json_dump_file(obj: Any, path: str):
+    """Same bytes as _json_dumps, written through a 1 MiB buffer; the stdlib
+    fallback streams encoder chunks instead of building one big string."""
+    with open(path, "wb", buffering=_WRITE_BUFFER) as f:
+        if orjson:
+            f.write(orjson.dumps(obj, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS))
+        else:
+            write = f.write
+            for chunk in json.JSONEncoder(indent=2, ensure_ascii=False).iterencode(obj):
+                write(chunk.encode("utf-8"))
+
+def _write_atomic(path: str, data: bytes):
+    """Write to a sibling temp file, then swap it in so a crash never leaves half a file."""
+    tmp = path + ".tmp"
+    with open(tmp, "wb") as f:
+        f.write(data)
+    os.replace(tmp, path)
+
+# path -> (bytes last read/written, file mtime then); lets no-op saves skip the disk
+_last_config_bytes: Dict[str, tuple] = {}
+
+def _remember_config(path: str, data: bytes):
+    _last_config_bytes[path] = (data, os.stat(path).st_mtime_ns)
+
+def _config_unchanged(path: str, data: bytes) -> bool:
+    cached = _last_config_bytes.get(path)
+    if cached is None and os.path.exists(path):
+        with open(path, "rb") as f:
+            _remember_config(path, f.read())   # first save: read the file once
+        cached = _last_config_bytes[path]
+    if cached is None or cached[0] != data:
+        return False
+    try:
+        return os.stat(path).st_mtime_ns == cached[1]  # untouched since we last saw it
+    except OSError:
+        return False
+
 def load_config(path: str) -> List[ToolSpec]:
     """Load the tools config file. 
     If missing, create a simple default config with one fake tool."""
@@ -104,20 +263,25 @@ def load_config(path: str) -> List[ToolSpec]:
             }
         ]
         os.makedirs(os.path.dirname(path), exist_ok=True)
-        with open(path, "w", encoding="utf-8") as f:
-            json.dump(default_config, f, indent=2, ensure_ascii=False)
+        _write_atomic(path, _json_dumps(default_config))
         print(f"[!] Config file not found. Created default at: {path}")
 
     # --- load normally ---
-    with open(path, "r", encoding="utf-8") as f:
-        raw = json.load(f)
+    with open(path, "rb") as f:
+        data = f.read()
+    _remember_config(path, data)
+    return _tools_from_json(_json_loads(data))
 
+def _tools_from_json(raw: List[dict]) -> List[ToolSpec]:
+    """Build ToolSpecs from an already-parsed config array."""
     tools: List[ToolSpec] = []
     for t in raw:
         inputs = []
         for i in t.get("inputs", []):
             i = dict(i)                      # copy
             i.pop("placeholder", None)       # drop legacy key safely
+            if isinstance(i.get("name"), str):
+                i["name"] = sys.intern(i["name"])   # shared with form/import dict keys
             inputs.append(InputSpec(**i))
 
         tools.append(
@@ -149,10 +313,171 @@ def save_config(path: str, tools: List[ToolSpec]):
 
             "notes": t.notes
         })
-    with open(path, "w", encoding="utf-8") as f:
-        json.dump(data, f, indent=2, ensure_ascii=False)
+    out = _json_dumps(data)
+    if _config_unchanged(path, out):
+        return
+    _write_atomic(path, out)
+    _remember_config(path, out)
 
 # ---------- Tool Editor Dialog ----------
+# snippet generation lookups (input type -> argparse type / CLI placeholder)
+_PY_TYPE_MAP = {"string":"str","file":"str","folder":"str","int":"int","float":"float","date":"str", "password":"str" }
+_CLI_PLACEHOLDER_MAP = {
+    "file":"<path/to/file>",
+    "folder":"<path/to/folder>",
+    "int":"<int>",
+    "float":"<float>",
+    "date":"<YYYY-MM-DD>",
+    "multienum":"<a,b,c>",
+}
+_QUOTED_TYPES = frozenset({"string","file","folder","date","enum","multienum", "password"})  # string-ish types get quotes
+
+# ======== class InputsTableModel =========================================================
+# =========================================================================================
+class InputsTableModel(QtCore.QAbstractTableModel):
+    """Plain-data rows behind the ToolEditor inputs table (no per-cell widgets)."""
+    HEADERS     = ["Name","Type","Label","Default","Choices","Required", "Read Only"]
+    TYPES       = ["string","int","float","file","folder","enum","multienum","toggle","date","list", "password"]
+    COL_TYPE    = 1
+    CHECK_COLS  = (5, 6)  # Required, Read Only
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self._rows: List[list] = []  # [name, type, label, default, choices, required, readonly]
+
+    @classmethod
+    def _row_from_spec(cls, spec: Optional[InputSpec]) -> list:
+        if not spec:
+            return ["", "string", "", "", "", False, False]
+        return [
+            spec.name,
+            spec.type if spec.type in cls.TYPES else "string",
+            spec.label or "",
+            "" if spec.default is None else str(spec.default),
+            ",".join(spec.choices) if spec.choices else "",
+            bool(spec.required),
+            bool(getattr(spec, "readonly", False)),
+        ]
+
+    # ----- public API
+    def set_specs(self, specs: List[InputSpec]):
+        self.beginResetModel()
+        self._rows = [self._row_from_spec(s) for s in specs]
+        self.endResetModel()
+
+    def append_row(self, spec: Optional[InputSpec] = None):
+        r = len(self._rows)
+        self.beginInsertRows(QtCore.QModelIndex(), r, r)
+        self._rows.append(self._row_from_spec(spec))
+        self.endInsertRows()
+
+    def remove_rows(self, rows):
+        for r in sorted(set(rows), reverse=True):
+            self.beginRemoveRows(QtCore.QModelIndex(), r, r)
+            del self._rows[r]
+            self.endRemoveRows()
+
+    def value(self, row: int, col: int):
+        return self._rows[row][col]
+
+    # ----- Qt model interface
+    def rowCount(self, parent=QtCore.QModelIndex()):
+        return 0 if parent.isValid() else len(self._rows)
+
+    def columnCount(self, parent=QtCore.QModelIndex()):
+        return 0 if parent.isValid() else len(self.HEADERS)
+
+    def headerData(self, section, orientation, role=Qt.DisplayRole):
+        if orientation == Qt.Horizontal and role == Qt.DisplayRole:
+            return self.HEADERS[section]
+        return None
+
+    def flags(self, index):
+        if not index.isValid():
+            return Qt.NoItemFlags
+        f = Qt.ItemIsEnabled | Qt.ItemIsSelectable
+        return f | (Qt.ItemIsUserCheckable if index.column() in self.CHECK_COLS else Qt.ItemIsEditable)
+
+    def data(self, index, role=Qt.DisplayRole):
+        if not index.isValid():
+            return None
+        val = self._rows[index.row()][index.column()]
+        if index.column() in self.CHECK_COLS:
+            return (_CHECKED if val else _UNCHECKED) if role == _CHECK_ROLE else None
+        return val if role in _TEXT_ROLES else None
+
+    def setData(self, index, value, role=Qt.EditRole):
+        if not index.isValid():
+            return False
+        if index.column() in self.CHECK_COLS:
+            if role != _CHECK_ROLE:
+                return False
+            value = Qt.CheckState(value) == _CHECKED
+        elif role == Qt.EditRole:
+            value = str(value)
+        else:
+            return False
+        self._rows[index.row()][index.column()] = value
+        self.dataChanged.emit(index, index, [role])
+        return True
+
+
+# ======== class InputsTableDelegate ======================================================
+# =========================================================================================
+class InputsTableDelegate(QtWidgets.QStyledItemDelegate):
+    """Creates an editor only for the cell being edited; draws check columns centered."""
+
+    def createEditor(self, parent, option, index):
+        if index.column() == InputsTableModel.COL_TYPE:
+            cb = QtWidgets.QComboBox(parent)
+            cb.addItems(InputsTableModel.TYPES)
+            cb.activated.connect(lambda _i, e=cb: self.commitData.emit(e))
+            return cb
+        return QtWidgets.QLineEdit(parent)
+
+    def setEditorData(self, editor, index):
+        val = index.data(Qt.EditRole) or ""
+        if isinstance(editor, QtWidgets.QComboBox):
+            editor.setCurrentText(val)
+        else:
+            editor.setText(val)
+
+    def setModelData(self, editor, model, index):
+        text = editor.currentText() if isinstance(editor, QtWidgets.QComboBox) else editor.text()
+        model.setData(index, text, Qt.EditRole)
+
+    def paint(self, painter, option, index):
+        if index.column() not in InputsTableModel.CHECK_COLS:
+            return super().paint(painter, option, index)
+        opt = QtWidgets.QStyleOptionViewItem(option)
+        self.initStyleOption(opt, index)
+        style = opt.widget.style() if opt.widget else QtWidgets.QApplication.style()
+        size = style.subElementRect(QtWidgets.QStyle.SE_ItemViewItemCheckIndicator, opt, opt.widget).size()
+
+        # cell background/selection, then the indicator in the middle of the cell
+        checked = opt.checkState == _CHECKED
+        opt.features &= ~QtWidgets.QStyleOptionViewItem.HasCheckIndicator
+        style.drawControl(QtWidgets.QStyle.CE_ItemViewItem, opt, painter, opt.widget)
+        opt.rect = QtWidgets.QStyle.alignedRect(opt.direction, Qt.AlignCenter, size, option.rect)
+        opt.state = (opt.state & ~QtWidgets.QStyle.State_HasFocus) | (
+            QtWidgets.QStyle.State_On if checked else QtWidgets.QStyle.State_Off)
+        style.drawPrimitive(QtWidgets.QStyle.PE_IndicatorItemViewItemCheck, opt, painter, opt.widget)
+
+    def editorEvent(self, event, model, option, index):
+        if index.column() not in InputsTableModel.CHECK_COLS:
+            return super().editorEvent(event, model, option, index)
+        et = event.type()
+        toggle = (
+            (et == QtCore.QEvent.MouseButtonRelease and event.button() == Qt.LeftButton)
+            or (et == QtCore.QEvent.KeyPress and event.key() in (Qt.Key_Space, Qt.Key_Select))
+        )
+        if toggle:
+            cur = index.data(_CHECK_ROLE)
+            new = _UNCHECKED if cur == _CHECKED else _CHECKED
+            return model.setData(index, new, _CHECK_ROLE)
+        return et == QtCore.QEvent.MouseButtonDblClick  # swallow, the release already toggled
+
+
 # ======== class ToolEditor ===============================================================
 # =========================================================================================
 class ToolEditor(QtWidgets.QDialog):
@@ -161,8 +486,12 @@ class ToolEditor(QtWidgets.QDialog):
         self.setWindowTitle("Add / Edit Tool")
         self.setMinimumWidth(750)
         self.tool = tool or ToolSpec(name="New Tool")
-        self.inputs_table = QtWidgets.QTableWidget(0, 7)
-        self.inputs_table.setHorizontalHeaderLabels(["Name","Type","Label","Default","Choices","Required", "Read Only"])
+        # Model/view table: cell editors are created only while a cell is edited
+        self.inputs_model = InputsTableModel(self)
+        self.inputs_table = QtWidgets.QTableView()
+        self.inputs_table.setModel(self.inputs_model)
+        self.inputs_table.setItemDelegate(InputsTableDelegate(self.inputs_table))
+        self.inputs_table.setEditTriggers(QtWidgets.QAbstractItemView.AllEditTriggers)
         # === Style the header ===
         header = self.inputs_table.horizontalHeader()
         header.setStyleSheet("""
@@ -221,28 +550,21 @@ class ToolEditor(QtWidgets.QDialog):
         v.addWidget(btn_box)
 
         # load existing inputs
-        for i in self.tool.inputs:
-            self._add_input_row(i)
+        self.inputs_model.set_specs(self.tool.inputs)
 
 
     # --- inside ToolEditor class ---
     def _read_inputs_from_table(self) -> List[InputSpec]:
         """Read current rows without committing the dialog."""
         specs: List[InputSpec] = []
-        for r in range(self.inputs_table.rowCount()):
-            name_w = self.inputs_table.cellWidget(r, 0)
-            type_w = self.inputs_table.cellWidget(r, 1)
-            label_w = self.inputs_table.cellWidget(r, 2)
-            default_w = self.inputs_table.cellWidget(r, 3)
-            # choices_w = self.inputs_table.cellWidget(r, 4)
-            if not name_w or not type_w:
-                continue
-            name = name_w.text().strip()
+        m = self.inputs_model
+        for r in range(m.rowCount()):
+            name = m.value(r, 0).strip()
             if not name:
                 continue
-            itype = type_w.currentText()
-            label = (label_w.text().strip() or None) if label_w else None
-            default_txt = default_w.text() if default_w else ""
+            itype = m.value(r, 1)
+            label = m.value(r, 2).strip() or None
+            default_txt = m.value(r, 3)
             if default_txt == "":
                 default = None
             elif itype == "int":
@@ -269,81 +591,53 @@ class ToolEditor(QtWidgets.QDialog):
     
     # --- inside ToolEditor class ---
     def _build_snippets(self, specs: List[InputSpec]) -> dict[str, str]:
-        def py_type(itype: str) -> str | None:
-            return {"string":"str","file":"str","folder":"str","int":"int","float":"float","date":"str", "password":"str" }.get(itype)
+        py_type = _PY_TYPE_MAP.get
+
+        lines    = ["import argparse\np = argparse.ArgumentParser()"]  # argparse
+        cli_bits = []                                                  # sample CLI line
+        parts    = ['{python_u} "{script}"']                            # runner template: {python_u} "{script}" + args
+        ph_lines = ["# Placeholders available in command templates:"]  # matches ToolForm._build_command extras
 
-        # argparse
-        lines = []
-        lines.append("import argparse\np = argparse.ArgumentParser()")
+        # one pass over the specs feeds all four snippets
         for s in specs:
-            flag = f'--{s.name}'
-            if s.type == "toggle":
-                default = "True" if str(s.default).strip().lower() in ("yes","true","on","1") else "False"
-                lines.append(f'p.add_argument("{flag}", action=argparse.BooleanOptionalAction, default={default})')
-            elif s.type in ("enum","multienum"):
+            n, t = s.name, s.type
+            flag, brace = f"--{n}", "{" + n + "}"
+            ph_lines.append(brace)
+            if t == "toggle":
+                on = str(s.default).strip().lower() in ("yes","true","on","1")
+                lines.append(f'p.add_argument("{flag}", action=argparse.BooleanOptionalAction, default={on})')
+                cli_bits.append(flag if on else f"--no-{n}")
+                parts.append("{" + n + "_flag}")
+                ph_lines.append("{" + n + f"_flag}}   # --{n} or --no-{n}")
+                ph_lines.append("{" + n + "_yn}     # yes/no")
+                ph_lines.append("{" + n + "_01}     # 1/0")
+                continue
+
+            default = "" if s.default in (None,"") else f", default={repr(s.default)}"
+            if t in ("enum","multienum"):
                 # multienum comes in as CSV string by default; keep as str for CLI and parse later
-                # choices = f", choices={s.choices}" if s.choices else ""
-                default = "" if s.default in (None,"") else f", default={repr(s.default)}"
-                # lines.append(f'p.add_argument("{flag}", type=str{choices}{default})')
                 lines.append(f'p.add_argument("{flag}", type=str{default})')
             else:
-                ty = py_type(s.type)
+                ty = py_type(t)
                 ty_part = f", type={ty}" if ty else ""
-                default = "" if s.default in (None,"") else f", default={repr(s.default)}"
                 required = ", required=True" if s.required else ""
-                help_part = f', help="{(s.label or s.name).replace(chr(34), chr(39))}"'
+                help_part = f', help="{(s.label or n).replace(chr(34), chr(39))}"'
                 lines.append(f'p.add_argument("{flag}"{ty_part}{required}{default}{help_part})')
-        lines.append("\nargs,_ = p.parse_known_args()\n")
-        argparse_block = "\n".join(lines)
 
-        # sample CLI line
-        cli_bits = []
-        for s in specs:
-            f = f"--{s.name}"
-            if s.type == "toggle":
-                on = str(s.default).strip().lower() in ("yes","true","on","1")
-                cli_bits.append(f if on else f"--no-{s.name}")
-            else:
-                val = s.default
-                if val in (None, ""):
-                    # show placeholder by type
-                    placeholder = {
-                        "file":"<path/to/file>",
-                        "folder":"<path/to/folder>",
-                        "int":"<int>",
-                        "float":"<float>",
-                        "date":"<YYYY-MM-DD>",
-                        "multienum":"<a,b,c>",
-                    }.get(s.type, "<value>")
-                    cli_bits.append(f'{f} {placeholder}')
-                else:
-                    cli_bits.append(f'{f} "{val}"' if isinstance(val, str) else f'{f} {val}')
-        sample_cli = "python -u your_script.py " + " ".join(cli_bits)
-        
-            # runner template: {python_u} "{script}" + args
-        parts = ['{python_u} "{script}"']
-        def needs_quotes(s):  # string-ish types get quotes
-            return s in ("string","file","folder","date","enum","multienum", "password")
-        for s in specs:
-            if s.type == "toggle":
-                parts.append(f"{{{s.name}_flag}}")
+            val = s.default
+            if val in (None, ""):
+                # show placeholder by type
+                cli_bits.append(f'{flag} {_CLI_PLACEHOLDER_MAP.get(t, "<value>")}')
             else:
-                if needs_quotes(s.type):
-                    parts.append(f'--{s.name} "{{{s.name}}}"')
-                else:
-                    parts.append(f'--{s.name} {{{s.name}}}')
-        runner_template = " ".join(parts)
+                cli_bits.append(f'{flag} "{val}"' if isinstance(val, str) else f'{flag} {val}')
 
+            parts.append(f'{flag} "{brace}"' if t in _QUOTED_TYPES else f'{flag} {brace}')
 
-        # runner placeholders (matches ToolForm._build_command extras)
-        ph_lines = ["# Placeholders available in command templates:"]
-        for s in specs:
-            ph_lines.append(f"{{{s.name}}}")
-            if s.type == "toggle":
-                ph_lines.append(f"{{{s.name}_flag}}   # --{s.name} or --no-{s.name}")
-                ph_lines.append(f"{{{s.name}_yn}}     # yes/no")
-                ph_lines.append(f"{{{s.name}_01}}     # 1/0")
-        ph_block = "\n".join(ph_lines)
+        lines.append("\nargs,_ = p.parse_known_args()\n")
+        argparse_block  = "\n".join(lines)
+        sample_cli      = "python -u your_script.py " + " ".join(cli_bits)
+        runner_template = " ".join(parts)
+        ph_block        = "\n".join(ph_lines)
 
         # JSON inputs array (handy for config authoring)
         import json as _json
@@ -420,80 +714,30 @@ class ToolEditor(QtWidgets.QDialog):
             
             
     def _add_input_row(self, spec: Optional[InputSpec] = None):
-        r = self.inputs_table.rowCount()
-        self.inputs_table.insertRow(r)
-
-		# Name
-        name = QtWidgets.QLineEdit(spec.name if spec else "")
-        self.inputs_table.setCellWidget(r, 0, name)
-
-		# Type
-        type_cb = QtWidgets.QComboBox()
-        type_cb.addItems(["string","int","float","file","folder","enum","multienum","toggle","date","list", "password"])
-
-        type_cb.setCurrentText(spec.type if spec else "string")
-        self.inputs_table.setCellWidget(r, 1, type_cb)
-
-		# Label
-        label = QtWidgets.QLineEdit(spec.label if spec else "")
-        self.inputs_table.setCellWidget(r, 2, label)
-
-		# Default
-        default = QtWidgets.QLineEdit("" if not spec or spec.default is None else str(spec.default))
-        self.inputs_table.setCellWidget(r, 3, default)
-
-		# Choices
-        choices = QtWidgets.QLineEdit("" if not spec or not spec.choices else ",".join(spec.choices))
-        self.inputs_table.setCellWidget(r, 4, choices)
-
-		# Required (centered)
-        req = QtWidgets.QCheckBox()
-        req.setChecked(spec.required if spec else False)
-        cell_req = QtWidgets.QWidget()
-        lay_req = QtWidgets.QHBoxLayout(cell_req); lay_req.setContentsMargins(0,0,0,0)
-        lay_req.addStretch(1); lay_req.addWidget(req); lay_req.addStretch(1)
-        self.inputs_table.setCellWidget(r, 5, cell_req)
-
-        # Read-only (centered)
-        ro = QtWidgets.QCheckBox()
-        ro.setChecked(getattr(spec, "readonly", False) if spec else False)
-        cell_ro = QtWidgets.QWidget()
-        lay_ro = QtWidgets.QHBoxLayout(cell_ro); lay_ro.setContentsMargins(0,0,0,0)
-        lay_ro.addStretch(1); lay_ro.addWidget(ro); lay_ro.addStretch(1)
-        self.inputs_table.setCellWidget(r, 6, cell_ro)
-        
+        self.inputs_model.append_row(spec or None)   # clicked(bool) passes False
+
     def _remove_selected_input_rows(self):
-        rows = sorted(set([i.row() for i in self.inputs_table.selectedIndexes()]), reverse=True)
-        for r in rows:
-            self.inputs_table.removeRow(r)
+        self.inputs_model.remove_rows(i.row() for i in self.inputs_table.selectedIndexes())
 
     def _get_checkbox_checked(self, row: int, col: int) -> bool:
-        cell = self.inputs_table.cellWidget(row, col)
-        if not cell: return False
-        lay = cell.layout()
-        if not lay: return False
-        for i in range(lay.count()):
-            w = lay.itemAt(i).widget()
-            if isinstance(w, QtWidgets.QCheckBox):
-                return w.isChecked()
-        return False
+        return bool(self.inputs_model.value(row, col))
 
 
     def result_tool(self) -> ToolSpec:
         # Build ToolSpec from UI
         inputs: List[InputSpec] = []
         
-        for r in range(self.inputs_table.rowCount()):
-            name = self.inputs_table.cellWidget(r, 0).text().strip()
+        m = self.inputs_model
+        for r in range(m.rowCount()):
+            name = m.value(r, 0).strip()
             if not name:
                 continue
 
-            type_cb: QtWidgets.QComboBox = self.inputs_table.cellWidget(r, 1)
-            itype = type_cb.currentText()
+            itype = m.value(r, 1)
 
-            label = self.inputs_table.cellWidget(r, 2).text().strip() or None
+            label = m.value(r, 2).strip() or None
 
-            default_txt = self.inputs_table.cellWidget(r, 3).text()
+            default_txt = m.value(r, 3)
             if default_txt == "":
                 default = None
             elif itype == "int":
@@ -505,7 +749,7 @@ class ToolEditor(QtWidgets.QDialog):
             else:
                 default = default_txt
 
-            choices_txt = self.inputs_table.cellWidget(r, 4).text().strip()
+            choices_txt = m.value(r, 4).strip()
             choices = [c.strip() for c in choices_txt.split(",")] if (choices_txt and itype in ("enum","multienum")) else None
             
             required = self._get_checkbox_checked(r, 5)
@@ -529,6 +773,288 @@ class ToolEditor(QtWidgets.QDialog):
         )
         return t
 
+# ======== form field builders ============================================================
+# =========================================================================================
+# one small factory per InputSpec.type, looked up once per field in ToolForm.set_tool;
+# the matching _DEFAULTS entry puts spec.default (or a blank value) into the widget,
+# so a form can be reset without being rebuilt
+_COMMA_SPLIT = re.compile(r"\s*,\s*")
+
+def _parse_csv(v) -> list:
+    # accept CSV or list; one regex pass splits and trims, empty parts dropped
+    if isinstance(v, str):
+        return [s for s in _COMMA_SPLIT.split(v.strip()) if s]
+    if isinstance(v, (list, tuple)):
+        return list(v)
+    return []
+
+_TRUTHY = frozenset(("1", "true", "yes", "on"))
+
+def _truthy(v) -> bool:
+    if v is True or v is False:
+        return v                      # native bools skip the str/strip/lower round trip
+    return v is not None and str(v).strip().lower() in _TRUTHY
+
+def _parse_iso_date(v) -> QtCore.QDate:
+    """'yyyy-MM-dd' -> QDate; plain ISO strings skip Qt's format parser."""
+    s = str(v)
+    if len(s) == 10 and s[4] == "-" and s[7] == "-":
+        y, m, d = s[:4], s[5:7], s[8:]
+        if (y + m + d).isascii() and (y + m + d).isdigit():
+            return QtCore.QDate(int(y), int(m), int(d))   # invalid dates stay invalid
+    return QtCore.QDate.fromString(s, "yyyy-MM-dd")
+
+def _mk_line(form, spec: InputSpec) -> QtWidgets.QWidget:
+    return QtWidgets.QLineEdit()
+
+def _mk_int(form, spec: InputSpec) -> QtWidgets.QWidget:
+    w = QtWidgets.QSpinBox(); w.setRange(-10**9, 10**9)
+    return w
+
+def _mk_float(form, spec: InputSpec) -> QtWidgets.QWidget:
+    w = QtWidgets.QDoubleSpinBox(); w.setRange(-1e12, 1e12); w.setDecimals(6)
+    return w
+
+def _mk_date(form, spec: InputSpec) -> QtWidgets.QWidget:
+    w = QtWidgets.QDateEdit(); w.setCalendarPopup(True); w.setDisplayFormat("yyyy-MM-dd")
+    return w
+
+def _mk_toggle(form, spec: InputSpec) -> QtWidgets.QWidget:
+    return QtWidgets.QCheckBox()
+
+def _mk_path(form, spec: InputSpec, folder=False) -> QtWidgets.QWidget:
+    line = QtWidgets.QLineEdit()
+    btn  = QtWidgets.QPushButton("...")
+    cnt  = QtWidgets.QWidget()
+    h = QtWidgets.QHBoxLayout(cnt); h.setContentsMargins(0,0,0,0)
+    h.addWidget(line, 1); h.addWidget(btn)
+    btn._line, btn._is_folder = line, folder    # read back by ToolForm._pick_path
+    btn.clicked.connect(form._pick_path)
+    cnt._file_line = line
+    return cnt
+
+def _mk_enum(form, spec: InputSpec) -> QtWidgets.QWidget:
+    w = QtWidgets.QComboBox()
+    if spec.choices: w.addItems(spec.choices)
+    return w
+
+def _mk_multienum(form, spec: InputSpec) -> QtWidgets.QWidget:
+    w = CheckableComboBox()
+    w.setChoices(spec.choices or [])
+    return w
+
+def _toggle_echo(le: QtWidgets.QLineEdit, shown: bool):
+    le.setEchoMode(QtWidgets.QLineEdit.Normal if shown else QtWidgets.QLineEdit.Password)
+
+def _mk_password(form, spec: InputSpec) -> QtWidgets.QWidget:
+    le = QtWidgets.QLineEdit()
+    le.setEchoMode(QtWidgets.QLineEdit.Password)
+
+    # add an inline eye icon to toggle visibility
+    act = QtGui.QAction(form)
+    act.setIcon(_std_icon(QtWidgets.QStyle.SP_DialogYesButton))  # simple icon; swap if you have an eye icon
+    act.setCheckable(True)
+    act.toggled.connect(partial(_toggle_echo, le))
+
+    le.addAction(act, QtWidgets.QLineEdit.TrailingPosition)
+    return le
+
+def _mk_list(form, spec: InputSpec) -> QtWidgets.QWidget:
+    w = QtWidgets.QPlainTextEdit()
+    w.setPlaceholderText("-")
+    w.setFixedHeight(100)
+    w.setSizePolicy(QtWidgets.QSizePolicy.Expanding, QtWidgets.QSizePolicy.Fixed)
+    return w
+
+_BUILDERS = {
+    "string":    _mk_line,
+    "int":       _mk_int,
+    "float":     _mk_float,
+    "date":      _mk_date,
+    "toggle":    _mk_toggle,
+    "file":      _mk_path,
+    "folder":    partial(_mk_path, folder=True),
+    "enum":      _mk_enum,
+    "multienum": _mk_multienum,
+    "password":  _mk_password,
+    "list":      _mk_list,
+}
+
+def _def_line(w, spec: InputSpec):
+    # set default if provided (use with care for passwords)
+    w.setText("" if spec.default is None else str(spec.default))
+
+def _def_path(w, spec: InputSpec):
+    w._file_line.setText(str(spec.default) if spec.default else "")
+
+def _def_int(w, spec: InputSpec):
+    w.setValue(spec.default if isinstance(spec.default, int) else 0)
+
+def _def_float(w, spec: InputSpec):
+    w.setValue(float(spec.default) if isinstance(spec.default, (int,float)) else 0.0)
+
+def _def_date(w, spec: InputSpec):
+    if spec.default:
+        qd = _parse_iso_date(spec.default)
+        w.setDate(qd if qd.isValid() else QtCore.QDate.currentDate())
+    else:
+        w.setDate(QtCore.QDate.currentDate())
+
+def _def_toggle(w, spec: InputSpec):
+    w.setChecked(_truthy(spec.default))
+
+def _def_enum(w, spec: InputSpec):
+    idx = w.findText(str(spec.default)) if spec.default is not None else -1
+    w.setCurrentIndex(idx if idx >= 0 else (0 if w.count() else -1))
+
+def _def_multienum(w, spec: InputSpec):
+    w.setCheckedItems(_parse_csv(spec.default) if spec.default else [])
+
+def _def_list(w, spec: InputSpec):
+    text = ""
+    if spec.default:
+        if isinstance(spec.default, str):
+            text = spec.default
+        elif isinstance(spec.default, (list, tuple)):
+            text = "\n".join(map(str, spec.default))
+    w.setPlainText(text)
+
+_DEFAULTS = {
+    "string":    _def_line,
+    "password":  _def_line,
+    "int":       _def_int,
+    "float":     _def_float,
+    "date":      _def_date,
+    "toggle":    _def_toggle,
+    "file":      _def_path,
+    "folder":    _def_path,
+    "enum":      _def_enum,
+    "multienum": _def_multienum,
+    "list":      _def_list,
+}
+
+# value readers, bound per field in ToolForm.set_tool so collect_values does not branch
+def _read_line(w):   return w.text().strip()
+def _read_path(w):   return w._file_line.text().strip()
+
+def _read_list(w):
+    lines = [ln.strip() for ln in w.toPlainText().splitlines() if ln.strip()]
+    return ",".join(lines)   # e.g. "alpha,beta,gamma"
+
+_READERS = {
+    "string":    _read_line,
+    "password":  _read_line,
+    "file":      _read_path,
+    "folder":    _read_path,
+    "int":       lambda w: int(w.value()),
+    "float":     lambda w: float(w.value()),
+    "enum":      lambda w: w.currentText(),
+    "multienum": lambda w: ",".join(w.checkedItems()),
+    "date":      lambda w: w.date().toString("yyyy-MM-dd"),
+    "toggle":    lambda w: w.isChecked(),
+    "list":      _read_list,
+}
+
+# setters used when parameters are imported: (widget, value) -> None
+_MISSING = object()     # "no value for this field" in imported dicts (None is a value)
+
+def _apply_default(w, v):
+    if isinstance(w, QtWidgets.QLineEdit):
+        w.setText(str(v or ""))
+
+def _apply_path(w, v):
+    w._file_line.setText(str(v or ""))
+
+def _apply_enum(w, v):
+    idx = w.findText(str(v))
+    if idx >= 0:
+        w.setCurrentIndex(idx)
+
+def _apply_date(w, v):
+    qd = _parse_iso_date(v)
+    if qd.isValid():
+        w.setDate(qd)
+
+def _apply_toggle(w, v):
+    # accept bool, "yes/no", "true/false", "1/0"
+    w.setChecked(_truthy(v))
+
+_APPLY_HANDLERS = {
+    "string":    _apply_default,
+    "password":  _apply_default,
+    "file":      _apply_path,
+    "folder":    _apply_path,
+    "int":       lambda w, v: w.setValue(int(v)),
+    "float":     lambda w, v: w.setValue(float(v)),
+    "enum":      _apply_enum,
+    "multienum": lambda w, v: w.setCheckedItems(_parse_csv(v)),
+    "date":      _apply_date,
+    "toggle":    _apply_toggle,
+    "list":      lambda w, v: w.setPlainText("\n".join(_parse_csv(v))),   # each item on its own line
+}
+
+# One sheet for the whole form, applied once on ToolForm; rules select by objectName.
+FORM_QSS = """
+    QPushButton#Primary{
+        background:#ADE4F7;
+        color:black;
+        border:1px solid #38B5E0;
+        border-radius:10px;
+        padding:9px 15px;
+        font-weight:600;
+    }
+    QPushButton#Primary:hover{ background:#38B5E0;}
+    QPushButton#Primary:pressed{ background:#104A91; border:none; border-radius:10px;}
+    QPushButton#Primary:disabled{ background:#D7DEDE; color:rgba(255,255,255,0.85); border:none; border-radius:10px;}
+
+    QPushButton#Danger{
+        background:#ED7272; color:black;
+        border:none; border-radius:10px;
+        padding:10px 16px; font-weight:600;
+    }
+    QPushButton#Danger:hover{ background:#80ED7272; }
+    QPushButton#Danger:pressed{ background:#b91c1c; }
+    QPushButton#Danger:disabled{ background:#D7DEDE; color:rgba(255,255,255,0.9); }
+
+    QPlainTextEdit#LogView {
+        background: #e9f1f6;      /* edit Application Logs background  e9f1f6 FFFFFF */
+        color: #010282;            /* text color */
+        selection-background-color: rgba(255,255,255,255);
+    }
+
+    QToolButton#InfoBtn { color: white; border: none; }
+    QToolButton#InfoBtn:hover   { background: #A7D9FC; }
+    QToolButton#InfoBtn:pressed { background: #83C8F7; }
+
+    QGroupBox#InputsBox {
+        border: 2px solid #33BEE8F7;
+        border-radius: 10px;
+        background:#80BEE8F7;  /*bright blue ade4f7 light blue 80BEE8F7 */
+        margin-top: 24px; padding-top: 12px;
+    }
+    QGroupBox#InputsBox::title {
+        subcontrol-origin: margin;
+        subcontrol-position: top left;
+        left: 0px; top: -5px;
+        padding: 0 6px;
+        font-size: 20px; font-weight: 900;
+        background: transparent;
+    }
+
+    /* Checkbox: no stretch background, just the square indicator */
+    QGroupBox#InputsBox QCheckBox { background: transparent; }
+    QGroupBox#InputsBox QCheckBox::indicator {
+        width: 18px; height: 18px;
+        border: 1px solid #94A3B8;
+        border-radius: 3px;
+        background: #ffffff;
+        margin: 0 6px 0 6px;
+    }
+    QGroupBox#InputsBox QCheckBox::indicator:hover   { border-color: #64748B; }
+    QGroupBox#InputsBox QCheckBox::indicator:checked { background: #ADE4F7; border-color: #38B5E0; image: none; }
+    QGroupBox#InputsBox QCheckBox::indicator:disabled{ background: #E5E7EB; border-color: #CBD5E1; }
+"""
+
 # ---------- Dynamic Form ----------
 # ======== class ToolForm =================================================================
 # =========================================================================================
@@ -537,6 +1063,7 @@ class ToolForm(QtWidgets.QWidget):
 
     def __init__(self, parent=None):
         super().__init__(parent)
+        self.setStyleSheet(FORM_QSS)  # parsed once; children pick it up as they are polished
         # ---- 0) Core state & essentials -------------------------------------
         self._init_state()
 
@@ -550,7 +1077,15 @@ class ToolForm(QtWidgets.QWidget):
         splitter = self._create_io_splitter(form_box, logs_panel)
         self._finalize_layout(title_row, splitter)
         self._wire_actions()
-        self.runner: Optional[QProcRunner] = None
+        # one runner (and QProcess) for the lifetime of the form, wired once
+        self.runner = QProcRunner(self)
+        self.runner.linesReady.connect(self._queue_log)
+        self.runner.finished.connect(self._on_finished)
+
+        # child environment, built once: system env + Python I/O overrides
+        self._base_env = QtCore.QProcessEnvironment.systemEnvironment()
+        self._base_env.insert("PYTHONUNBUFFERED", "1")     # unbuffer stdout/stderr
+        self._base_env.insert("PYTHONIOENCODING", "utf-8") # good for non-ASCII output
 
     # ========================================================================
     # =============== Helper builders (private methods) =======================
@@ -561,7 +1096,11 @@ class ToolForm(QtWidgets.QWidget):
         """Initialize model/fields and top-level layout container."""
         self._busy = False
         self.tool: Optional[ToolSpec] = None
+        self._tool_info_html: Optional[str] = None
+        self._toggle_names: frozenset = frozenset()
+        self._form_fp: Optional[tuple] = None     # fingerprint of the form currently built
         self.fields: Dict[str, QtWidgets.QWidget] = {}
+        self._readers: Dict[str, tuple] = {}   # name -> (widget, value reader), bound in set_tool
 
         # frequently referenced widgets
         # self.output_dir = QtWidgets.QLineEdit()
@@ -569,6 +1108,20 @@ class ToolForm(QtWidgets.QWidget):
         self.status     = QtWidgets.QLabel("Ready")
         self.cwd        = os.getcwd()
 
+        # process output is buffered here and flushed to the log by a timer
+        self._pending_log: List[str] = []
+        self._log_started = False       # a flush landed since the last clear, even an empty line
+        self._log_timer = QtCore.QTimer(self)
+        self._log_timer.setSingleShot(True)
+        self._log_timer.setInterval(LOG_FLUSH_MS)
+        self._log_timer.timeout.connect(self._on_log_tick)
+
+        # one trailing fit of the inputs box per burst of rebuilds
+        self._fit_timer = QtCore.QTimer(self)
+        self._fit_timer.setSingleShot(True)
+        self._fit_timer.setInterval(50)
+        self._fit_timer.timeout.connect(self._fit_inputs_height)
+
         # Root layout of this widget
         self._root_v = QtWidgets.QVBoxLayout(self)
         self._root_v.setContentsMargins(0, 0, 0, 0)
@@ -583,8 +1136,8 @@ class ToolForm(QtWidgets.QWidget):
 
         self.run_btn.setObjectName("Primary")
         self.stop_btn.setObjectName("Danger")
-        self.run_btn.setIcon(self.style().standardIcon(QtWidgets.QStyle.SP_MediaPlay))
-        self.stop_btn.setIcon(self.style().standardIcon(QtWidgets.QStyle.SP_BrowserStop))
+        self.run_btn.setIcon(_std_icon(QtWidgets.QStyle.SP_MediaPlay))
+        self.stop_btn.setIcon(_std_icon(QtWidgets.QStyle.SP_BrowserStop))
         self.run_btn.setMinimumWidth(140)
         self.stop_btn.setMinimumWidth(140)
 
@@ -594,33 +1147,6 @@ class ToolForm(QtWidgets.QWidget):
         self.import_btn.setMinimumWidth(80)
         self.export_btn.setMinimumWidth(80)
 
-        # Styles exactly as before btn_run btn run 
-        self.run_btn.setStyleSheet("""
-        QPushButton#Primary{
-            background:#ADE4F7;
-            color:black;
-            border:1px solid #38B5E0;
-            border-radius:10px;
-            padding:9px 15px;
-            font-weight:600;
-        }               
-        
-        QPushButton#Primary:hover{ background:#38B5E0;}
-        QPushButton#Primary:pressed{ background:#104A91; border:none; border-radius:10px;}
-        QPushButton#Primary:disabled{ background:#D7DEDE; color:rgba(255,255,255,0.85); border:none; border-radius:10px;}
-        """)
-        
-        self.stop_btn.setStyleSheet("""
-        QPushButton#Danger{
-            background:#ED7272; color:black;
-            border:none; border-radius:10px;
-            padding:10px 16px; font-weight:600;
-        }
-        QPushButton#Danger:hover{ background:#80ED7272; }
-        QPushButton#Danger:pressed{ background:#b91c1c; }
-        QPushButton#Danger:disabled{ background:#D7DEDE; color:rgba(255,255,255,0.9); }
-        """)
-
         # Build the row layout and keep a handle for later
         self._btn_row = QtWidgets.QHBoxLayout()
         self._btn_row.addWidget(self.run_btn)
@@ -636,30 +1162,12 @@ class ToolForm(QtWidgets.QWidget):
         self.log.setObjectName("LogView")
         self.log.setSizePolicy(QtWidgets.QSizePolicy.Expanding, QtWidgets.QSizePolicy.Expanding)
         self.log.setMinimumHeight(80)
-        try:
-            mono = QtGui.QFontDatabase.systemFont(QtGui.QFontDatabase.FixedFont)
-        except Exception:
-            for fam in ["Consolas", "Cascadia Mono", "Courier New", "DejaVu Sans Mono", "Menlo", "Monaco"]:
-                if QtGui.QFont(fam).exactMatch():
-                    mono = QtGui.QFont(fam)
-                    break
-            else:
-                mono = self.font()
-        mono.setPointSize(12)
-        self.log.setFont(mono)
+        self.log.setFont(_mono_font())
         self.log.setLineWrapMode(QtWidgets.QPlainTextEdit.NoWrap)
-        metrics = QtGui.QFontMetricsF(mono)
-        self.log.setTabStopDistance(4 * metrics.horizontalAdvance(" "))
+        self.log.setTabStopDistance(_mono_tabstop())
         self.log.setReadOnly(True)
-        
-        self.log.setObjectName("LogView")
-        self.log.setStyleSheet("""
-            QPlainTextEdit#LogView {
-                background: #e9f1f6;      /* edit Application Logs background  e9f1f6 FFFFFF */
-                color: #010282;            /* text color */
-                selection-background-color: rgba(255,255,255,255);
-            }
-        """)
+        self.log.setMaximumBlockCount(LOG_MAX_BLOCKS)
+        self.log.document().setUndoRedoEnabled(False)   # read-only: no undo stack to feed
 
         self.log.setAutoFillBackground(True)
 
@@ -700,36 +1208,7 @@ class ToolForm(QtWidgets.QWidget):
 
         # Group box shell and style
         self._form_box = QtWidgets.QGroupBox("Application Inputs:")
-        base_css = """
-            QGroupBox {
-                border: 2px solid #33BEE8F7;
-                border-radius: 10px;
-                background:#80BEE8F7;  /*bright blue ade4f7 light blue 80BEE8F7 */
-                margin-top: 24px; padding-top: 12px;
-            }
-            QGroupBox::title {
-                subcontrol-origin: margin;
-                subcontrol-position: top left;
-                left: 0px; top: -5px;
-                padding: 0 6px;
-                font-size: 20px; font-weight: 1200;
-                background: transparent;
-            }
-
-            /* Checkbox: no stretch background, just the square indicator */
-            QCheckBox { background: transparent; }
-            QCheckBox::indicator {
-                width: 18px; height: 18px;
-                border: 1px solid #94A3B8;
-                border-radius: 3px;
-                background: #ffffff;
-                margin: 0 6px 0 6px;
-            }
-            QCheckBox::indicator:hover   { border-color: #64748B; }
-            QCheckBox::indicator:checked { background: #ADE4F7; border-color: #38B5E0; image: none; }
-            QCheckBox::indicator:disabled{ background: #E5E7EB; border-color: #CBD5E1; }
-        """
-        self._form_box.setStyleSheet(base_css)
+        self._form_box.setObjectName("InputsBox")
 
         lay = QtWidgets.QVBoxLayout()
         lay.setContentsMargins(0, 0, 0, 0)
@@ -742,10 +1221,14 @@ class ToolForm(QtWidgets.QWidget):
         self._form_box.setSizePolicy(QtWidgets.QSizePolicy.Expanding,      QtWidgets.QSizePolicy.Maximum)
 
         # Initial fit to content
-        QtCore.QTimer.singleShot(0, self._fit_inputs_height)
+        self._schedule_fit()
         return self._form_box
 
     
+    def _schedule_fit(self):
+        self._fit_timer.start()   # restarting pushes the pending fit back
+
+    @QtCore.Slot()
     def _fit_inputs_height(self):
         """
         Cap the inputs box so it never grows beyond its content,
@@ -797,14 +1280,9 @@ class ToolForm(QtWidgets.QWidget):
 
         ICON_PX, PADDING = 30, 2
         SIDE = ICON_PX + PADDING * 2
-        self.info_btn.setIcon(self.style().standardIcon(QtWidgets.QStyle.SP_MessageBoxInformation))
+        self.info_btn.setIcon(_std_icon(QtWidgets.QStyle.SP_MessageBoxInformation))
         self.info_btn.setIconSize(QtCore.QSize(ICON_PX, ICON_PX))
         self.info_btn.setFixedSize(SIDE, SIDE)
-        self.info_btn.setStyleSheet("""
-        QToolButton#InfoBtn { color: white; border: none; }
-        QToolButton#InfoBtn:hover   { background: #A7D9FC; }
-        QToolButton#InfoBtn:pressed { background: #83C8F7; }
-        """)
 
         row = QtWidgets.QHBoxLayout()
         row.addWidget(self.tool_title)
@@ -846,48 +1324,76 @@ class ToolForm(QtWidgets.QWidget):
         self.export_btn.clicked.connect(self._export_params)
         self.import_btn.clicked.connect(self._import_params)
         
+    @QtCore.Slot()
     def _safe_clear_form_layout(self):
+        # removeRow drops label + field together and deletes both; going from the
+        # last row avoids shifting the remaining rows on every removal
         lay = self.form_layout
-        while lay.count():
-            item = lay.takeAt(0)
-            w = item.widget()
-            if w is not None:
-                w.deleteLater()
+        updates = self.updatesEnabled()
+        self.setUpdatesEnabled(False)
+        for r in range(lay.rowCount() - 1, -1, -1):
+            lay.removeRow(r)
+        self.setUpdatesEnabled(updates)
     
+    @QtCore.Slot()
     def _show_tool_info(self):
         if not self.tool:
             QtWidgets.QMessageBox.information(self, "About this tool", "No tool selected.")
             return
 
+        msg = QtWidgets.QMessageBox(self)
+        msg.setWindowTitle("About this tool")
+        msg.setIcon(QtWidgets.QMessageBox.Information)
+        msg.setTextFormat(QtCore.Qt.RichText)  # ensure HTML is used
+        if self._tool_info_html is None:
+            self._tool_info_html = self._build_tool_info_html(self.tool)
+        msg.setText(self._tool_info_html)
+        # optional: allow selecting/copying text
+        msg.setTextInteractionFlags(QtCore.Qt.TextSelectableByMouse | QtCore.Qt.LinksAccessibleByMouse)
+        msg.exec()
+
+    @QtCore.Slot()
+    def _pick_path(self):
+        """Shared picker for every file/folder row; the clicked button names its line edit."""
+        btn = self.sender()
+        le = btn._line
+        if btn._is_folder:
+            fn = QtWidgets.QFileDialog.getExistingDirectory(self, "Select Folder", le.text() or self.cwd)
+        else:
+            fn, _ = QtWidgets.QFileDialog.getOpenFileName(self, "Select File", le.text() or self.cwd, "All files (*.*)")
+        if fn: le.setText(fn)
+
+    @staticmethod
+    def _build_tool_info_html(t: ToolSpec) -> str:
+        """Info popup body for a tool; built on the first click after set_tool, then reused."""
         esc = html.escape
-        t    = self.tool
         title = esc(t.name or "Untitled tool")
         notes = esc((t.notes or "—").strip())
 
-        # Build parameters list as HTML
-        items = []
-        iCountParameter = 0
-        for spec in t.inputs:
-            
-            label = esc(spec.label or spec.name)
-            typ   = esc(spec.type or "string")
-            req   = "required" if spec.required else "optional"
-            iCountParameter += 1
-
-            bits = [f"<b>{iCountParameter} : {label}</b> <span style='color:#888;'>[{typ}, {req}]</span>"]
-            if spec.default not in (None, ""):
-                shown_default = "••••" if (spec.type or "").lower() == "password" else str(spec.default)
-                bits.append(f"<div style='margin-left:.1em'><i>Default:</i> {esc(shown_default)}</div>")
-                # bits.append(f"<div style='margin-left:.1em'><i>Default:</i> {esc(str(spec.default))}</div>")
-            if spec.choices:
-                choices = ", ".join(esc(str(c)) for c in spec.choices)
-                bits.append(f"<div style='margin-left:.1em'><i>Choices:</i> {choices}</div>")
-            
-            items.append("<li>" + "".join(bits) + "</li>")            
-
-        params_html = "<ul style='margin:0 0 0 .1em; padding:0'>" + "".join(items) + "</ul>" if items else "—"
-
-        html_body = f"""
+        # Build parameters list as HTML into one buffer
+        if t.inputs:
+            buf = StringIO(); w = buf.write
+            w("<ul style='margin:0 0 0 .1em; padding:0'>")
+            for n, spec in enumerate(t.inputs, 1):
+                label = esc(spec.label or spec.name)
+                typ   = esc(spec.type or "string")
+                req   = "required" if spec.required else "optional"
+
+                w(f"<li><b>{n} : {label}</b> <span style='color:#888;'>[{typ}, {req}]</span>")
+                if spec.default not in (None, ""):
+                    shown_default = "••••" if (spec.type or "").lower() == "password" else str(spec.default)
+                    w(f"<div style='margin-left:.1em'><i>Default:</i> {esc(shown_default)}</div>")
+                if spec.choices:
+                    w("<div style='margin-left:.1em'><i>Choices:</i> ")
+                    w(", ".join(esc(str(c)) for c in spec.choices))
+                    w("</div>")
+                w("</li>")
+            w("</ul>")
+            params_html = buf.getvalue()
+        else:
+            params_html = "—"
+
+        return f"""
         <div style="font-size: 12pt; font-weight:700; margin-bottom:6px;">{title}</div>
         <div style="margin:10px 0 4px 0;"><b>Tool information</b></div>
         <div>{notes}</div>        
@@ -895,134 +1401,73 @@ class ToolForm(QtWidgets.QWidget):
         {params_html}
         """
 
-        msg = QtWidgets.QMessageBox(self)
-        msg.setWindowTitle("About this tool")
-        msg.setIcon(QtWidgets.QMessageBox.Information)
-        msg.setTextFormat(QtCore.Qt.RichText)  # ensure HTML is used
-        msg.setText(html_body)
-        # optional: allow selecting/copying text
-        msg.setTextInteractionFlags(QtCore.Qt.TextSelectableByMouse | QtCore.Qt.LinksAccessibleByMouse)
-        msg.exec()
-    
+    @staticmethod
+    def _form_fingerprint(tool: ToolSpec) -> tuple:
+        """Everything the built form depends on; equal fingerprints give identical forms."""
+        return (tool.name, tool.notes, tuple(
+            (i.name, i.type, i.label, repr(i.default), tuple(i.choices or ()), i.required, i.readonly)
+            for i in tool.inputs))
+
+    def _reset_values(self):
+        """Put every field back to its spec default without recreating widgets."""
+        for spec in self.tool.inputs:
+            w = self.fields.get(spec.name)
+            if w is not None:
+                _DEFAULTS.get(spec.type, _def_line)(w, spec)
+
     def set_tool(self, tool: ToolSpec):
         if self._busy:
             return
+
+        fp = self._form_fingerprint(tool)
+        if fp == self._form_fp:
+            # same form: keep the widgets, only reset them (runner/script may differ)
+            self.tool = tool
+            self._reset_values()
+            self._pending_log.clear()
+            self.log.clear()
+            self._log_started = False
+            self.status.setText("Ready")
+            return
         self._busy = True
         self.setUpdatesEnabled(False)
+
+        # Detach the form container while it is rebuilt, so adding rows does not
+        # trigger a geometry/layout pass through the scroll area for every field
+        cont = self._form_scroll.takeWidget()
+        cont.setUpdatesEnabled(False)
+        cont.blockSignals(True)
+        self.form_layout.setEnabled(False)
         try:
             self.tool = tool
+            self._toggle_names = frozenset(i.name for i in tool.inputs if i.type == "toggle")
             self.tool_title.setText(f"<b>{tool.name}</b>")
+            self._tool_info_html = None     # rebuilt lazily by _show_tool_info
 
             # SAFE clear
             self._safe_clear_form_layout()
             self.fields.clear()
+            self._readers.clear()
 
             # ===== build dynamic fields of selected tool, mini app =====            
             iCountParam = 0
+            rows = []                      # (label, widget), added to the layout in one go
             for spec in tool.inputs:
                 label = spec.label or spec.name
                 
-                w: QtWidgets.QWidget
-                if spec.type == "string":
-                    w = QtWidgets.QLineEdit()
-                    if spec.default is not None: w.setText(str(spec.default))
-                elif spec.type == "int":
-                    w = QtWidgets.QSpinBox(); w.setRange(-10**9, 10**9)
-                    if isinstance(spec.default, int): w.setValue(spec.default)
-                elif spec.type == "float":
-                    w = QtWidgets.QDoubleSpinBox(); w.setRange(-1e12, 1e12); w.setDecimals(6)
-                    if isinstance(spec.default, (int,float)): w.setValue(float(spec.default))
-                elif spec.type == "date":
-                    w = QtWidgets.QDateEdit(); w.setCalendarPopup(True); w.setDisplayFormat("yyyy-MM-dd")
-                    if spec.default:
-                        qd = QtCore.QDate.fromString(str(spec.default), "yyyy-MM-dd")
-                        w.setDate(qd if qd.isValid() else QtCore.QDate.currentDate())
-                    else:
-                        w.setDate(QtCore.QDate.currentDate())
-                elif spec.type == "toggle":
-                    w = QtWidgets.QCheckBox()
-                    d = str(spec.default).strip().lower() if spec.default is not None else ""
-                    w.setChecked(d in ("yes", "true", "on", "1"))
-                    
-                elif spec.type == "file":
-                    line = QtWidgets.QLineEdit()
-                    btn  = QtWidgets.QPushButton("...")
-                    cnt  = QtWidgets.QWidget()
-                    h = QtWidgets.QHBoxLayout(cnt); h.setContentsMargins(0,0,0,0)
-                    h.addWidget(line, 1); h.addWidget(btn)
-                    def pick_file(checked=False, le=line):
-                        fn, _ = QtWidgets.QFileDialog.getOpenFileName(self, "Select File", le.text() or self.cwd, "All files (*.*)")
-                        if fn: le.setText(fn)
-                    btn.clicked.connect(pick_file)
-                    w = cnt; w._file_line = line
-                elif spec.type == "folder":
-                    line = QtWidgets.QLineEdit()
-                    btn  = QtWidgets.QPushButton("...")
-                    cnt  = QtWidgets.QWidget()
-                    h = QtWidgets.QHBoxLayout(cnt); h.setContentsMargins(0,0,0,0)
-                    h.addWidget(line, 1); h.addWidget(btn)
-                    def pick_folder(checked=False, le=line):
-                        fn = QtWidgets.QFileDialog.getExistingDirectory(self, "Select Folder", le.text() or self.cwd)
-                        if fn: le.setText(fn)
-                    btn.clicked.connect(pick_folder)
-                    w = cnt; w._file_line = line
-                elif spec.type == "enum":
-                    w = QtWidgets.QComboBox()
-                    if spec.choices: w.addItems(spec.choices)
-                    if spec.default is not None:
-                        idx = w.findText(str(spec.default))
-                        if idx >= 0: w.setCurrentIndex(idx)
-                elif spec.type == "multienum":
-                    w = CheckableComboBox()
-                    w.setChoices(spec.choices or [])
-                    defaults = []
-                    if spec.default:
-                        if isinstance(spec.default, str):
-                            defaults = [s.strip() for s in spec.default.split(",") if s.strip()]
-                        elif isinstance(spec.default, (list, tuple)):
-                            defaults = list(spec.default)
-                    w.setCheckedItems(defaults)
-                elif spec.type == "password":
-                    le = QtWidgets.QLineEdit()
-                    le.setEchoMode(QtWidgets.QLineEdit.Password)
-
-                    # set default if provided (use with care)
-                    if spec.default is not None:
-                        le.setText(str(spec.default))
-
-                    # add an inline eye icon to toggle visibility
-                    act = QtGui.QAction(self)
-                    act.setIcon(self.style().standardIcon(QtWidgets.QStyle.SP_DialogYesButton))  # simple icon; swap if you have an eye icon
-                    act.setCheckable(True)
-                    def _toggle_pwd():
-                        le.setEchoMode(QtWidgets.QLineEdit.Normal if act.isChecked() else QtWidgets.QLineEdit.Password)
-                    act.toggled.connect(_toggle_pwd)
-
-                    le.addAction(act, QtWidgets.QLineEdit.TrailingPosition)
-                    w = le
-
-                elif spec.type == "list":
-                    w = QtWidgets.QPlainTextEdit()
-                    w.setPlaceholderText("-")
-                    w.setFixedHeight(100)
-                    w.setSizePolicy(QtWidgets.QSizePolicy.Expanding, QtWidgets.QSizePolicy.Fixed)
-                    if spec.default:
-                        if isinstance(spec.default, str):
-                            w.setPlainText(spec.default)
-                        elif isinstance(spec.default, (list, tuple)):
-                            w.setPlainText("\n".join(map(str, spec.default)))
-                else:
-                    w = QtWidgets.QLineEdit()
-
-                if hasattr(w, "_file_line") and spec.default:
-                    w._file_line.setText(str(spec.default))
-                elif isinstance(w, QtWidgets.QLineEdit) and spec.default is not None:
-                    w.setText(str(spec.default))
+                kind = spec.type if spec.type in _BUILDERS else "string"
+                w = _BUILDERS[kind](self, spec)
+                w._plar_kind = kind          # widget class is fixed by this; handlers trust it
+                _DEFAULTS.get(spec.type, _def_line)(w, spec)
 
                 iCountParam += 1
                 
-                self.form_layout.addRow(f'{iCountParam} : {label}' + ("" if not spec.required else " *"), w)
-                self.fields[spec.name] = w
+                lbl = QtWidgets.QLabel(f'{iCountParam} : {label}' + ("" if not spec.required else " *"))
+                lbl.setSizePolicy(QtWidgets.QSizePolicy.Fixed, QtWidgets.QSizePolicy.Preferred)
+                rows.append((lbl, w))
+                name = sys.intern(spec.name)
+                self.fields[name] = w
+                self._readers[name] = (w, _READERS.get(spec.type, _read_line))
 
                 if getattr(spec, "readonly", False):
                     if isinstance(w, (QtWidgets.QLineEdit, QtWidgets.QPlainTextEdit)):
@@ -1030,16 +1475,29 @@ class ToolForm(QtWidgets.QWidget):
                     elif isinstance(w, QtWidgets.QComboBox):
                         w.setEnabled(False)
 
+            for lbl, w in rows:
+                self.form_layout.addRow(lbl, w)
+
             # self.output_dir.setText("")
+            self._pending_log.clear()
             self.log.clear()
+            self._log_started = False
             self.status.setText("Ready")
+            self._form_fp = fp
         except Exception as e:
+            self._form_fp = None        # half-built form: never reuse it
             import traceback
             tb = "".join(traceback.format_exception(type(e), e, e.__traceback__))
             QtWidgets.QMessageBox.critical(self, "Form Build Error", tb)
         finally:
+            # re-attach the rebuilt container: a single layout activation
+            self.form_layout.setEnabled(True)
+            cont.blockSignals(False)
+            cont.setUpdatesEnabled(True)
+            self._form_scroll.setWidget(cont)
+
             # at the very end of set_tool(...)
-            QtCore.QTimer.singleShot(0, self._fit_inputs_height)
+            self._schedule_fit()
 
             self.setUpdatesEnabled(True)
             self._busy = False
@@ -1047,40 +1505,16 @@ class ToolForm(QtWidgets.QWidget):
 
 
     def collect_values(self) -> Dict[str, Any]:
-        vals = {}
         if not self.tool:
-            return vals
-        for spec in self.tool.inputs:
-            w = self.fields.get(spec.name)
-            if not w: continue
-            if spec.type in ("string","file","folder","password"):
-                if hasattr(w, "_file_line"):
-                    vals[spec.name] = w._file_line.text().strip()
-                else:
-                    vals[spec.name] = w.text().strip()
-            elif spec.type == "int":
-                vals[spec.name] = int(w.value())
-            elif spec.type == "float":
-                vals[spec.name] = float(w.value())
-            elif spec.type == "enum":
-                vals[spec.name] = w.currentText()
-            elif spec.type == "multienum":
-                vals[spec.name] = ",".join(self.fields[spec.name].checkedItems())
-            elif spec.type == "date":
-                vals[spec.name] = w.date().toString("yyyy-MM-dd")
-            elif spec.type == "toggle":
-                vals[spec.name] = w.isChecked()
-            elif spec.type == "list":
-                lines = [ln.strip() for ln in w.toPlainText().splitlines() if ln.strip()]
-                vals[spec.name] = ",".join(lines)   # e.g. "alpha,beta,gamma"
-
-            else:
-                vals[spec.name] = str(w.text()).strip()
+            return {}
+        vals = {name: read(w) for name, (w, read) in self._readers.items()}
         # vals["_output_dir"] = self.output_dir.text().strip() or None
         return vals
 
+    @QtCore.Slot()
     def _on_run(self):
-        if not self.tool:
+        # shortcuts still reach here while the Run button is disabled
+        if not self.tool or self.runner.p.state() != QtCore.QProcess.NotRunning:
             return
         vals = self.collect_values()
         for spec in self.tool.inputs:
@@ -1107,42 +1541,72 @@ class ToolForm(QtWidgets.QWidget):
         self._pending_cmd = cmd
         QtCore.QTimer.singleShot(0, self._start_run)
 
+    @QtCore.Slot()
     def _start_run(self):
         cmd = getattr(self, "_pending_cmd", None)
         if not cmd:
             return
 
-        self.runner = QProcRunner(self)
-        self.runner.lineReady.connect(lambda s: self.log.appendPlainText(s))
-        self.runner.finished.connect(self._on_finished)
-        
-        env = os.environ.copy()
-        env["PYTHONUNBUFFERED"] = "1"     # unbuffer stdout/stderr
-        env["PYTHONIOENCODING"] = "utf-8" # good for non-ASCII output
-        
         # self.runner.start(cmd, cwd=None)   # keep current working directory
-        self.runner.start(cmd, cwd=None, env=env) 
-
+        self.runner.start(cmd, cwd=None, env=self._base_env)
+
+    @QtCore.Slot(list)
+    def _queue_log(self, lines: List[str]):
+        # throttle: the first batch after a quiet period is shown at once,
+        # anything arriving during the window goes out when it closes
+        self._pending_log.extend(lines)
+        if not self._log_timer.isActive():
+            self._flush_log()
+            self._log_timer.start()
+
+    @QtCore.Slot()
+    def _on_log_tick(self):
+        tail = self.runner.take_partial()
+        if tail:
+            self._pending_log.append(tail)
+        if self._pending_log:
+            self._flush_log()
+            self._log_timer.start()     # keep throttling while output keeps coming
+
+    @QtCore.Slot()
+    def _flush_log(self):
+        if not self._pending_log:
+            return
+        # one insertText at the end of the document per flush; a private cursor
+        # leaves the user's selection alone
+        doc = self.log.document()
+        bar = self.log.verticalScrollBar()
+        follow = bar.value() == bar.maximum()
+        cur = QtGui.QTextCursor(doc)
+        cur.movePosition(QtGui.QTextCursor.End)
+        text = "\n".join(self._pending_log)
+        # a first flush of [""] leaves the document empty but still owns a line
+        cur.insertText("\n" + text if self._log_started or not doc.isEmpty() else text)
+        self._log_started = True
+        self._pending_log.clear()
+        if follow:
+            bar.setValue(bar.maximum())
+
+    @QtCore.Slot()
     def _on_stop(self):
-        if self.runner:
-            self.runner.kill()
+        self.runner.kill()                # no-op when nothing is running
         self.status.setText("Stopping...")
 
+    @QtCore.Slot(int)
     def _on_finished(self, code: int):
+        self._log_timer.stop()
+        self._flush_log()
         self.status.setText(f"Finished with code {code}")
         self.run_btn.setEnabled(True)
         self.stop_btn.setEnabled(False)
-        self.runner = None
 
 
     def _build_command(self, tool: ToolSpec, vals: Dict[str, Any]) -> List[str]:
-        
-        py = sys.executable.replace(chr(92), chr(47))
-        
-        if not os.path.isfile(py):
+        py = _PY_EXE
+        if not _PY_EXE_OK:
             raise ValueError("Python service not found: " + py)
 
-        toggle_names = {i.name for i in tool.inputs if i.type == "toggle"}
+        toggle_names = self._toggle_names if tool is self.tool else {i.name for i in tool.inputs if i.type == "toggle"}
         # Provide a common placeholder dictionary
         placeholders = {
             **vals, 
@@ -1162,8 +1626,22 @@ class ToolForm(QtWidgets.QWidget):
         # command template, e.g.: "{python} {script} --in {images} --mode {mode} --out {output_dir}"
         if not tool.runner:
             raise ValueError("Command template is empty.")
-        # string substitute
+        tokens = _compile_runner(tool.runner)
         try:
+            if tokens is not None:
+                # an unquoted {name} expands to the words of its value, as shlex would split it
+                argv = []
+                for kind, v in tokens:
+                    if kind == "lit":
+                        argv.append(v)
+                        continue
+                    text = format(placeholders[v])
+                    if text and _SHLEX_CHARS.isdisjoint(text):
+                        argv.append(text)
+                    else:
+                        argv.extend(shlex.split(text))
+                return argv
+            # string substitute
             templ = tool.runner.format(**placeholders)
         except KeyError as e:
             raise ValueError(f"Missing placeholder in template: {e}")
@@ -1189,85 +1667,57 @@ class ToolForm(QtWidgets.QWidget):
         """Apply a dict of name->value to the current form fields by type."""
         if not self.tool:
             return
-        for spec in self.tool.inputs:
-            name = spec.name
-            if name not in values:
-                continue
-            v = values[name]
-            w = self.fields.get(name)
-            if not w:
-                continue
-
-            t = spec.type or "string"
-            try:
-                if t in ("string", "file", "folder", "password"):
-                    if hasattr(w, "_file_line"):
-                        w._file_line.setText(str(v or ""))
-                    elif isinstance(w, QtWidgets.QLineEdit):
-                        w.setText(str(v or ""))
-                elif t == "int" and isinstance(w, QtWidgets.QSpinBox):
-                    w.setValue(int(v))
-                elif t == "float" and isinstance(w, QtWidgets.QDoubleSpinBox):
-                    w.setValue(float(v))
-                elif t == "enum" and isinstance(w, QtWidgets.QComboBox):
-                    idx = w.findText(str(v))
-                    if idx >= 0:
-                        w.setCurrentIndex(idx)
-                elif t == "multienum" and hasattr(w, "setCheckedItems"):
-                    if isinstance(v, str):
-                        items = [s.strip() for s in v.split(",") if s.strip()]
-                    elif isinstance(v, (list, tuple)):
-                        items = list(v)
-                    else:
-                        items = []
-                    w.setCheckedItems(items)
-                elif t == "date" and isinstance(w, QtWidgets.QDateEdit):
-                    qd = QtCore.QDate.fromString(str(v), "yyyy-MM-dd")
-                    if qd.isValid():
-                        w.setDate(qd)
-                elif t == "toggle" and isinstance(w, QtWidgets.QCheckBox):
-                    # accept bool, "yes/no", "true/false", "1/0"
-                    sv = str(v).strip().lower()
-                    on = v is True or sv in ("1", "true", "yes", "on")
-                    w.setChecked(on)
-                elif t == "list" and isinstance(w, QtWidgets.QPlainTextEdit):
-                    # accept CSV or list; store each on its own line
-                    if isinstance(v, str):
-                        items = [s.strip() for s in v.split(",") if s.strip()]
-                    elif isinstance(v, (list, tuple)):
-                        items = list(v)
-                    else:
-                        items = []
-                    w.setPlainText("\n".join(items))
-                else:
-                    # default / fallback
-                    if isinstance(w, QtWidgets.QLineEdit):
-                        w.setText(str(v or ""))
-            except Exception as e:
-                # Non-fatal: continue applying what we can
-                self.log.appendPlainText(f"[apply] {name}: {e}")
-        QtCore.QTimer.singleShot(0, self._fit_inputs_height)
+        # one quiet window for the whole import: no per-field signals or repaints
+        touched = []
+        # loop-invariant lookups bound once
+        track, field_of, handler_of = touched.append, self.fields.get, _APPLY_HANDLERS.get
+        log_append = self.log.appendPlainText
+        value_of = values.get
+        self.setUpdatesEnabled(False)
+        try:
+            for spec in self.tool.inputs:
+                name = spec.name
+                v = value_of(name, _MISSING)
+                if v is _MISSING:
+                    continue
+                w = field_of(name)
+                if w is None:
+                    continue
+
+                track((w, w.blockSignals(True)))
+                apply = handler_of(getattr(w, "_plar_kind", None), _apply_default)
+                try:
+                    apply(w, v)
+                except Exception as e:
+                    # Non-fatal: continue applying what we can
+                    log_append(f"[apply] {name}: {e}")
+        finally:
+            for w, was_blocked in touched:
+                w.blockSignals(was_blocked)
+            self.setUpdatesEnabled(True)
+        self._fit_inputs_height()
 
+    @QtCore.Slot()
     def _export_params(self):
         """Export current parameters to a JSON file."""
         if not self.tool:
             QtWidgets.QMessageBox.information(self, "Export", "No tool selected.")
             return
-        safe_tool = "".join(c for c in (self.tool.name or "tool") if c.isalnum() or c in (" ","-","_")).strip()
+        safe_tool = _safe_file_stem(self.tool.name or "tool")
         suggested = f"{safe_tool} - {time.strftime('%Y%m%d-%H%M%S')}.plar.json"
         fn, _ = QtWidgets.QFileDialog.getSaveFileName(
             self, "Export Parameters", suggested, "PLAR Settings (*.plar.json);;JSON (*.json);;All files (*.*)"
         )
         if not fn:
             return
+        payload = self._params_dict()     # widget reads only; the try below is for the file
         try:
-            payload = self._params_dict()
-            with open(fn, "w", encoding="utf-8") as f:
-                json.dump(payload, f, indent=2, ensure_ascii=False)
+            _json_dump_file(payload, fn)
             self.status.setText(f"Exported parameters → {Path(fn).name}")
         except Exception as e:
             QtWidgets.QMessageBox.critical(self, "Export Failed", str(e))
 
+    @QtCore.Slot()
     def _import_params(self):
         """Import parameters from a JSON file and apply to current form."""
         if not self.tool:
@@ -1279,11 +1729,14 @@ class ToolForm(QtWidgets.QWidget):
         if not fn:
             return
         try:
-            with open(fn, "r", encoding="utf-8") as f:
-                data = json.load(f)
+            with open(fn, "rb") as f:
+                data = _json_loads(f.read())
             # accept either {"meta":..., "values":...} or plain dict of values
             meta = data.get("meta", {}) if isinstance(data, dict) else {}
             values = data.get("values", data if isinstance(data, dict) else {})
+            if isinstance(values, dict):
+                # keys now share the interned spec-name strings: identity hits in lookups
+                values = {sys.intern(k) if isinstance(k, str) else k: v for k, v in values.items()}
 
             # Friendly guard: tool mismatch
             meta_tool = (meta.get("tool") or "").strip()
@@ -1308,9 +1761,26 @@ class ToolForm(QtWidgets.QWidget):
 class CheckableComboBox(QtWidgets.QComboBox):
     """Multi-select dropdown with checkmarks + one-line summary, aligned popup."""
     changed = QtCore.Signal()
+    MAX_SHOW = 20       # names spelled out in the summary before "(+N)"
 
     def __init__(self, parent=None):
         super().__init__(parent)
+        # state first: change events can arrive while the combo is being set up
+        # popup frame and the combo width its size was last fitted to
+        self._popup_frame: Optional[QtWidgets.QWidget] = None
+        self._popup_width = -1
+
+        # what the summary was last rendered from, to skip identical re-renders
+        self._last_full: Optional[str] = None
+        self._last_width = -1
+        self._last_elided: Optional[str] = None
+        self._fm: Optional[QtGui.QFontMetrics] = None   # line edit metrics, dropped on font change
+
+        # checked texts in row order; None = rescan the model on next use
+        self._checked: Optional[List[str]] = None
+        self._checked_rows: List[int] = []      # model rows behind _checked, ascending
+        self._toggling = False
+
         self.setView(QtWidgets.QListView())
         self.setModel(QtGui.QStandardItemModel(self))
 
@@ -1327,9 +1797,9 @@ class CheckableComboBox(QtWidgets.QComboBox):
         self.view().pressed.connect(self._toggle_item)
 
         # Keep the summary in sync when model changes in any way
-        self.model().dataChanged.connect(self._update_text)
-        self.model().rowsInserted.connect(self._update_text)
-        self.model().rowsRemoved.connect(self._update_text)
+        self.model().dataChanged.connect(self._on_data_changed)
+        self.model().rowsInserted.connect(self._on_model_changed)
+        self.model().rowsRemoved.connect(self._on_model_changed)
         self.currentIndexChanged.connect(self._update_text)
 
         # Avoid built-in text overriding our summary
@@ -1337,61 +1807,233 @@ class CheckableComboBox(QtWidgets.QComboBox):
 
     # ----- public API
     def setChoices(self, choices):
-        self.model().clear()
+        flags = QtCore.Qt.ItemIsEnabled | QtCore.Qt.ItemIsUserCheckable
+        items = []
         for text in (choices or []):
             it = QtGui.QStandardItem(str(text))
-            it.setFlags(QtCore.Qt.ItemIsEnabled | QtCore.Qt.ItemIsUserCheckable)
-            it.setData(QtCore.Qt.Unchecked, QtCore.Qt.CheckStateRole)
-            self.model().appendRow(it)
-        self._update_text()
+            it.setFlags(flags)
+            it.setData(_UNCHECKED, _CHECK_ROLE)
+            items.append(it)
+        m = self.model()
+        m.clear()
+        if items:
+            m.invisibleRootItem().appendRows(items)   # one rowsInserted -> _on_model_changed
+        else:
+            self._on_model_changed()      # clear() only resets the model, so drop the cache here
 
     def setCheckedItems(self, items):
-        want = set(map(str, items or []))
-        for row in range(self.model().rowCount()):
-            it = self.model().item(row)
-            it.setCheckState(QtCore.Qt.Checked if it.text() in want else QtCore.Qt.Unchecked)
-        self._update_text()
+        want = frozenset(map(str, items or []))
+        m = self.model()
+        n = m.rowCount()
+        if not n:
+            self._on_model_changed()
+            return
+        # set every row quietly, then announce the whole column once
+        item = m.item
+        was_blocked = m.blockSignals(True)
+        try:
+            for row in range(n):
+                it = item(row)
+                it.setCheckState(_CHECKED if it.text() in want else _UNCHECKED)
+        finally:
+            m.blockSignals(was_blocked)
+        # one dataChanged: repaints the view and runs _update_text once
+        m.dataChanged.emit(m.index(0, 0), m.index(n - 1, 0), [_CHECK_ROLE])
 
     def checkedItems(self):
-        out = []
-        for row in range(self.model().rowCount()):
-            it = self.model().item(row)
-            if it.checkState() == QtCore.Qt.Checked:
-                out.append(it.text())
-        return out
+        if self._checked is None:
+            m = self.model()
+            item = m.item
+            rows = [r for r in range(m.rowCount()) if item(r).checkState() == _CHECKED]
+            self._checked_rows = rows
+            self._checked = [item(r).text() for r in rows]
+        return list(self._checked)
 
     # ----- internals
     def _toggle_item(self, idx: QtCore.QModelIndex):
         it = self.model().itemFromIndex(idx)
-        it.setCheckState(QtCore.Qt.Unchecked if it.checkState() == QtCore.Qt.Checked
-                         else QtCore.Qt.Checked)
+        on = it.checkState() != _CHECKED
+        if self._checked is None:
+            self.checkedItems()
+        # our own dataChanged must not drop the cache we are about to patch
+        self._toggling = True
+        try:
+            it.setCheckState(_CHECKED if on else _UNCHECKED)
+        finally:
+            self._toggling = False
+
+        # one row changed: patch the row-ordered cache in place instead of rescanning
+        row, rows = idx.row(), self._checked_rows
+        pos = bisect_left(rows, row)
+        present = pos < len(rows) and rows[pos] == row
+        if on and not present:
+            rows.insert(pos, row)
+            self._checked.insert(pos, it.text())
+        elif not on and present:
+            del rows[pos], self._checked[pos]
         self._update_text()
         self.changed.emit()
 
+    def _on_data_changed(self, top_left, bottom_right, roles=()):
+        # only check state or text feed the summary; empty roles means "everything changed"
+        if roles and not any(r in _SUMMARY_ROLES for r in roles):
+            return
+        self._on_model_changed()
+
+    def _on_model_changed(self, *_):
+        if self._toggling:
+            return
+        self._checked = None
+        self._update_text()
+
     def _update_text(self):
-        sel = self.checkedItems()
+        sel = self.checkedItems() if self._checked is None else self._checked
         full = ", ".join(sel) if sel else "— none —"
+        width = self.width()
+        le = self.lineEdit()
+        # same selection, same width, and nothing (e.g. an index change) overwrote the text
+        if full == self._last_full and width == self._last_width and le.text() == self._last_elided:
+            return
 
         # one-line summary: first 20, then (+N)
-        MAX_SHOW = 20
-        display = full if len(sel) <= MAX_SHOW else ", ".join(sel[:MAX_SHOW]) + f" (+{len(sel)-MAX_SHOW})"
+        n = len(sel)
+        display = full if n <= self.MAX_SHOW else f"{', '.join(islice(sel, self.MAX_SHOW))} (+{n - self.MAX_SHOW})"
 
         # elide to widget width
-        fm = self.lineEdit().fontMetrics()
-        elided = fm.elidedText(display, QtCore.Qt.ElideRight, max(60, self.width() - 28))
-        self.lineEdit().setText(elided)
-        self.setToolTip(full)
+        fm = self._fm
+        if fm is None:
+            fm = self._fm = le.fontMetrics()
+        elided = fm.elidedText(display, _ELIDE_RIGHT, max(60, width - 28))
+        if le.text() != elided:
+            le.setText(elided)
+        if full != self._last_full:
+            self.setToolTip(full)
+        self._last_full, self._last_width, self._last_elided = full, width, elided
 
     def resizeEvent(self, e):
         super().resizeEvent(e)
         self._update_text()  # keep eliding correct on resize
 
+    def changeEvent(self, e):
+        super().changeEvent(e)
+        if e.type() in (QtCore.QEvent.FontChange, QtCore.QEvent.StyleChange):
+            self._fm = None
+            self._last_width = -1   # force a re-elide with the new metrics
+            self._update_text()
+
     def showPopup(self):
         super().showPopup()
         # Make popup the same width and aligned under the combo (no shift)
-        popup = self.view().window()  # QFrame created by QComboBox        
-        popup.setFixedWidth(int(self.width() * 1.15))
-        popup.move(self.mapToGlobal(QtCore.QPoint(0, self.height())))
+        popup = self._popup_frame
+        if popup is None:
+            popup = self._popup_frame = self.view().window()  # QFrame created by QComboBox
+        w = self.width()
+        if w != self._popup_width:          # fixed width sticks between opens
+            popup.setFixedWidth(int(w * 1.15))
+            self._popup_width = w
+        pos = self.mapToGlobal(QtCore.QPoint(0, self.height()))
+        if popup.pos() != pos:              # Qt re-places the frame on every open
+            popup.move(pos)
+
+
+# ======== class ToolListModel ============================================================
+# =========================================================================================
+class ToolListModel(QtCore.QAbstractListModel):
+    """Numbered tool names over MainWindow.tools; edits signal only the rows they touch."""
+
+    def __init__(self, tools: List[ToolSpec], parent=None):
+        super().__init__(parent)
+        self.tools = tools
+        self.bold_row = -1
+        self.bold_font: Optional[QtGui.QFont] = None
+        self._labels: List[Optional[str]] = [None] * len(tools)  # None = format on next paint
+
+    def _digits(self) -> int:
+        return max(2, len(str(len(self.tools))))
+
+    def rowCount(self, parent=QtCore.QModelIndex()):
+        return 0 if parent.isValid() else len(self.tools)
+
+    def data(self, index, role=QtCore.Qt.DisplayRole):
+        row = index.row()
+        if not index.isValid() or row >= len(self.tools):
+            return None
+        if role == QtCore.Qt.DisplayRole:
+            label = self._labels[row]
+            if label is None:
+                label = self._labels[row] = f"{row+1:0{self._digits()}d} : {self.tools[row].name}"
+            return label
+        if role == QtCore.Qt.UserRole:
+            return self.tools[row].name
+        if role == QtCore.Qt.FontRole and row == self.bold_row:
+            return self.bold_font
+        return None
+
+    def _rows_changed(self, first: int, last: int = -1, roles=()):
+        last = len(self.tools) - 1 if last < 0 else last
+        if 0 <= first <= last:
+            if not roles or QtCore.Qt.DisplayRole in roles:
+                self._labels[first:last + 1] = [None] * (last + 1 - first)
+            self.dataChanged.emit(self.index(first), self.index(last), list(roles))
+
+    def reset(self, tools: List[ToolSpec]):
+        self.beginResetModel()
+        self.tools = tools
+        self.bold_row = -1
+        self._labels = [None] * len(tools)
+        self.endResetModel()
+
+    def tool_changed(self, row: int):
+        self._rows_changed(row, row)
+
+    def insert_tool(self, row: int, tool: ToolSpec):
+        digits = self._digits()
+        self.beginInsertRows(QtCore.QModelIndex(), row, row)
+        self.tools.insert(row, tool)
+        self._labels.insert(row, None)
+        if self.bold_row >= row:
+            self.bold_row += 1
+        self.endInsertRows()
+        # later rows are renumbered; a wider counter relabels everything
+        self._rows_changed(0 if self._digits() != digits else row + 1)
+
+    def remove_tool(self, row: int):
+        digits = self._digits()
+        self.beginRemoveRows(QtCore.QModelIndex(), row, row)
+        del self.tools[row]
+        del self._labels[row]
+        if self.bold_row == row:
+            self.bold_row = -1
+        elif self.bold_row > row:
+            self.bold_row -= 1
+        self.endRemoveRows()
+        self._rows_changed(0 if self._digits() != digits else row)
+
+    def swap_tools(self, row: int, other: int):
+        """Swap two neighbouring tools (other = row ± 1)."""
+        lo, hi = min(row, other), max(row, other)
+        # moving `lo` below `hi` means inserting before hi + 1
+        self.beginMoveRows(QtCore.QModelIndex(), lo, lo, QtCore.QModelIndex(), hi + 1)
+        self.tools[lo], self.tools[hi] = self.tools[hi], self.tools[lo]
+        if self.bold_row in (lo, hi):
+            self.bold_row = lo + hi - self.bold_row
+        self.endMoveRows()
+        self._rows_changed(lo, hi, (QtCore.Qt.DisplayRole,))     # numbers follow the rows
+
+    def set_bold_row(self, row: int):
+        old, self.bold_row = self.bold_row, row
+        if old != row:
+            for r in (old, row):
+                self._rows_changed(r, r, (QtCore.Qt.FontRole,))
+
+
+# ======== class SingleClickList ==========================================================
+# =========================================================================================
+class SingleClickList(QtWidgets.QListView):
+    """Tool list that ignores double-clicks; only single selection changes matter."""
+
+    def mouseDoubleClickEvent(self, e):
+        e.accept()
 
 
 # ---------- Main Window ----------
@@ -1409,9 +2051,18 @@ class MainWindow(QtWidgets.QMainWindow):
         self._select_timer.setSingleShot(True)
         self._select_timer.timeout.connect(self._apply_selection)
 
+        # edits/moves save through this so a burst writes the config once
+        self._save_timer = QtCore.QTimer(self)
+        self._save_timer.setSingleShot(True)
+        self._save_timer.setInterval(300)
+        self._save_timer.timeout.connect(lambda: self._save(silent=True))
+
         # Left: tools list
-        self.list = QtWidgets.QListWidget()
-        self.list.itemSelectionChanged.connect(self._on_select)
+        self.tool_model = ToolListModel(self.tools, self)
+        self.list = SingleClickList()
+        self.list.setObjectName("ToolList")
+        self.list.setModel(self.tool_model)
+        self.list.selectionModel().selectionChanged.connect(self._on_select)
         self.list.setMinimumWidth(260)
         self.list.setAlternatingRowColors(True)
         self.list.setSpacing(2)
@@ -1419,7 +2070,6 @@ class MainWindow(QtWidgets.QMainWindow):
         # NEW: tame selection spam & double-clicks
         self.list.setSelectionMode(QtWidgets.QAbstractItemView.SingleSelection)
         self.list.setSelectionBehavior(QtWidgets.QAbstractItemView.SelectRows)
-        self.list.installEventFilter(self)
 
         self._last_applied_row = -1     # remember last row we actually built
         
@@ -1430,9 +2080,9 @@ class MainWindow(QtWidgets.QMainWindow):
         font.setPointSize(11)          # try 13–15
         # font.setBold(True)             # optional
         self.list.setFont(font)
-        
-        
-        self._reload_list()
+        bold = QtGui.QFont(font)
+        bold.setBold(True)
+        self.tool_model.bold_font = bold
 
         # Right: form
         self.form = ToolForm()
@@ -1465,20 +2115,40 @@ class MainWindow(QtWidgets.QMainWindow):
         QMenu::item:selected { background: rgba(37, 99, 235, 0.12); }
         """)
         
-        # ---- Actions (create FIRST)
-        add_act   = QtGui.QAction("Add Tool", self);    add_act.triggered.connect(self._add_tool)
-        edit_act  = QtGui.QAction("Edit Tool", self);   edit_act.triggered.connect(self._edit_tool)
-        dup_act   = QtGui.QAction("Duplicate", self);   dup_act.triggered.connect(self._dup_tool)
-        del_act   = QtGui.QAction("Delete", self);      del_act.triggered.connect(self._del_tool)
-        save_act  = QtGui.QAction("Save Config", self); save_act.triggered.connect(self._save)
+        # ---- Actions (create FIRST); the list's context menu reuses these too
+        self.act_run  = QtGui.QAction(_std_icon(QtWidgets.QStyle.SP_MediaPlay), "Run", self)
+        self.act_info = QtGui.QAction(_std_icon(QtWidgets.QStyle.SP_MessageBoxInformation), "Info", self)
+        self.act_add  = QtGui.QAction(_std_icon(QtWidgets.QStyle.SP_FileDialogNewFolder), "Add Tool", self)
+        self.act_edit = QtGui.QAction(_std_icon(QtWidgets.QStyle.SP_FileDialogDetailedView), "Edit Tool", self)
+        self.act_dup  = QtGui.QAction(_std_icon(QtWidgets.QStyle.SP_DialogOkButton), "Duplicate", self)
+        self.act_del  = QtGui.QAction(_std_icon(QtWidgets.QStyle.SP_TrashIcon), "Delete", self)
+        self.act_move_up   = QtGui.QAction("Move Up", self)
+        self.act_move_down = QtGui.QAction("Move Down", self)
+        self.act_save = QtGui.QAction("Save Config", self)
         load_cfg_act = QtGui.QAction("Load Config File…", self)
+
+        self.act_run.triggered.connect(self._run_selected)
+        self.act_info.triggered.connect(self.form._show_tool_info)
+        self.act_add.triggered.connect(self._add_tool)
+        self.act_edit.triggered.connect(self._edit_tool)
+        self.act_dup.triggered.connect(self._dup_tool)
+        self.act_del.triggered.connect(self._del_tool)
+        self.act_move_up.triggered.connect(lambda: self._move_tool(-1))
+        self.act_move_down.triggered.connect(lambda: self._move_tool(+1))
+        self.act_save.triggered.connect(self._save)
+
+        # icons show in the context menu only; the menubar stays text-only
+        self._icon_acts = (self.act_run, self.act_info, self.act_add,
+                           self.act_edit, self.act_dup, self.act_del)
+        for a in self._icon_acts:
+            a.setIconVisibleInMenu(False)
         
         
         # optional shortcuts
-        add_act.setShortcut("Ctrl+N")
-        edit_act.setShortcut("Ctrl+E")
-        dup_act.setShortcut("Ctrl+D")
-        del_act.setShortcut("Del")
+        self.act_add.setShortcut("Ctrl+N")
+        self.act_edit.setShortcut("Ctrl+E")
+        self.act_dup.setShortcut("Ctrl+D")
+        self.act_del.setShortcut("Del")
         load_cfg_act.setShortcut("Ctrl+L") 
 
         # # --- Theme menu (stable switching) ---
@@ -1506,16 +2176,26 @@ class MainWindow(QtWidgets.QMainWindow):
 
         # ---- Menus (add actions AFTER they exist)
         m_tools = mb.addMenu("Tools")
-        m_tools.addAction(add_act)
-        m_tools.addAction(edit_act)
-        m_tools.addAction(dup_act)
+        m_tools.addAction(self.act_add)
+        m_tools.addAction(self.act_edit)
+        m_tools.addAction(self.act_dup)
         m_tools.addSeparator()
-        m_tools.addAction(del_act)
+        m_tools.addAction(self.act_del)
         m_tools.addSeparator()
         m_tools.addAction(load_cfg_act)
 
         m_file = mb.addMenu("File")
-        m_file.addAction(save_act)
+        m_file.addAction(self.act_save)
+
+        # List context menu: built once, shown on every right-click
+        self._list_menu = QtWidgets.QMenu(self)
+        self._list_menu.addActions([self.act_run, self.act_info])
+        self._list_menu.addSeparator()
+        self._list_menu.addActions([self.act_add, self.act_edit, self.act_dup, self.act_del])
+        self._list_menu.addSeparator()
+        self._list_menu.addActions([self.act_move_up, self.act_move_down])
+        self._list_menu.addSeparator()
+        self._list_menu.addAction(self.act_save)
 
         # Central splitter
         splitter = QtWidgets.QSplitter()
@@ -1535,9 +2215,9 @@ class MainWindow(QtWidgets.QMainWindow):
         self.setCentralWidget(central)
         
         # Global (in-window) shortcut: Ctrl+R, Ctrl+Enter, Ctrl+Return to run the selected tool
-        for seq in ("Ctrl+R", "Ctrl+Return", "Ctrl+Enter", "F2"):
-            sc = QtGui.QShortcut(QtGui.QKeySequence(seq), self)
-            sc.activated.connect(self._shortcut_run)
+        sc = QtGui.QShortcut(self)      # one shortcut object matching all four keys
+        sc.setKeys([QtGui.QKeySequence(seq) for seq in ("Ctrl+R", "Ctrl+Return", "Ctrl+Enter", "F2")])
+        sc.activated.connect(self._shortcut_run)
         
         # smoother divider drag (less repaint work)
         splitter.setOpaqueResize(False)
@@ -1546,13 +2226,18 @@ class MainWindow(QtWidgets.QMainWindow):
         self._resizing = False
         self._resize_coalesce = QtCore.QTimer(self)
         self._resize_coalesce.setSingleShot(True)
-        self._resize_coalesce.setInterval(140)  # 120–180ms feels good
+        self._resize_coalesce.setInterval(60)   # still collapses a drag burst, feels snappier
         self._resize_coalesce.timeout.connect(self._end_resize)
 
         self.statusBar().showMessage("Ready")
 
-        if self.list.count() > 0:
-            self.list.setCurrentRow(0)
+        if self.tools:
+            self._set_current_row(0)
+
+    def closeEvent(self, event):
+        if self._save_timer.isActive():   # flush a debounced save before quitting
+            self._save(silent=True)
+        super().closeEvent(event)
 
     def resizeEvent(self, event):
         # On first tick of a resize burst, freeze heavy widgets only
@@ -1570,15 +2255,16 @@ class MainWindow(QtWidgets.QMainWindow):
         self.form.log.setUpdatesEnabled(True)
         self.form.setUpdatesEnabled(True)
         self._resizing = False
-        # one clean repaint
-        self.form.update()
-    def eventFilter(self, obj, ev):
-        if obj is self.list and ev.type() == QtCore.QEvent.MouseButtonDblClick:
-            return True  # swallow double-clicks; we only want single selection changes
-        return super().eventFilter(obj, ev)
+        # setUpdatesEnabled(True) already repaints what got dirty during the freeze
     
+    def _current_row(self) -> int:
+        return self.list.currentIndex().row()
+
+    def _set_current_row(self, row: int):
+        self.list.setCurrentIndex(self.tool_model.index(row))
+
     def _current_tool_index(self) -> int:
-        idx = self.list.currentRow()
+        idx = self._current_row()
         return idx if 0 <= idx < len(self.tools) else -1
 
     def _run_selected(self):
@@ -1594,43 +2280,31 @@ class MainWindow(QtWidgets.QMainWindow):
         new_idx = idx + delta
         if not (0 <= new_idx < len(self.tools)):
             return
-        self.tools[idx], self.tools[new_idx] = self.tools[new_idx], self.tools[idx]
-        self._reload_list()
-        self.list.setCurrentRow(new_idx)
-        self._save(silent=True)
+        # the selection rides along with the moved row; keep the built-row marker with it
+        self.tool_model.swap_tools(idx, new_idx)
+        if self._last_applied_row in (idx, new_idx):
+            self._last_applied_row = idx + new_idx - self._last_applied_row
+        self._set_current_row(new_idx)
+        self._save_timer.start()
 
     def _show_list_menu(self, pos: QtCore.QPoint):
-        item = self.list.itemAt(pos)
-        has_item = item is not None
-        global_pos = self.list.mapToGlobal(pos)
-
-        s = self.style()
-        menu = QtWidgets.QMenu(self)
-
-        # Top actions (item-specific)
-        act_run  = menu.addAction(s.standardIcon(QtWidgets.QStyle.SP_MediaPlay), "Run", self._run_selected)
-        act_info = menu.addAction(s.standardIcon(QtWidgets.QStyle.SP_MessageBoxInformation), "Info", 
-                                lambda: self.form._show_tool_info() if has_item else None)
-        menu.addSeparator()
-
-        act_add  = menu.addAction(s.standardIcon(QtWidgets.QStyle.SP_FileDialogNewFolder), "Add Tool", self._add_tool)
-        act_edit = menu.addAction(s.standardIcon(QtWidgets.QStyle.SP_FileDialogDetailedView), "Edit Tool", self._edit_tool)
-        act_dup  = menu.addAction(s.standardIcon(QtWidgets.QStyle.SP_DialogOkButton), "Duplicate", self._dup_tool)
-        act_del  = menu.addAction(s.standardIcon(QtWidgets.QStyle.SP_TrashIcon), "Delete", self._del_tool)
-        menu.addSeparator()
-
-        act_up   = menu.addAction("Move Up",   lambda: self._move_tool(-1))
-        act_down = menu.addAction("Move Down", lambda: self._move_tool(+1))
-        menu.addSeparator()
-
-        act_save = menu.addAction("Save Config", self._save)
+        has_item = self.list.indexAt(pos).isValid()
+        item_acts = (self.act_run, self.act_info, self.act_edit, self.act_dup,
+                     self.act_del, self.act_move_up, self.act_move_down)
 
         # Enable/disable depending on whether we clicked an item
-        for a in (act_run, act_info, act_edit, act_dup, act_del, act_up, act_down):
+        for a in item_acts:
             a.setEnabled(has_item)
-
-        # Show the menu
-        menu.exec(global_pos)
+        for a in self._icon_acts:
+            a.setIconVisibleInMenu(True)
+        try:
+            self._list_menu.exec(self.list.mapToGlobal(pos))
+        finally:
+            # the menubar and shortcuts share these actions; restore their menubar state
+            for a in item_acts:
+                a.setEnabled(True)
+            for a in self._icon_acts:
+                a.setIconVisibleInMenu(False)
     
     def _focus_main_and_select(self):
         # Show the main window if minimized / hidden
@@ -1640,10 +2314,12 @@ class MainWindow(QtWidgets.QMainWindow):
         self.activateWindow()
 
         # Ensure a tool is selected
-        if self._current_tool_index() < 0 and self.list.count() > 0:
+        if self._current_tool_index() < 0 and self.tools:
             row = self._last_applied_row if self._last_applied_row >= 0 else 0
-            self.list.setCurrentRow(max(0, min(row, self.list.count() - 1)))
-            QtCore.QCoreApplication.processEvents(QtCore.QEventLoop.AllEvents, 50)
+            self._set_current_row(max(0, min(row, len(self.tools) - 1)))
+            # build the form now instead of pumping the event loop for the debounce
+            self._select_timer.stop()
+            self._apply_selection(sync=True)
 
     def _shortcut_run(self):
         self._focus_main_and_select()
@@ -1651,38 +2327,30 @@ class MainWindow(QtWidgets.QMainWindow):
 
     
     def _reload_list(self):
-    # keep current selection if you want
-        current_name = None
-        if (it := self.list.currentItem()):
-            current_name = it.data(QtCore.Qt.UserRole) or it.text()
-
-        self.list.blockSignals(True)
-        self.list.clear()
-
-        digits = max(2, len(str(len(self.tools))))  # or just use 2
+        """Full refresh after self.tools was replaced (config loaded from disk)."""
+        row = self._current_row()
+        old = self.tool_model.tools
+        current_name = old[row].name if 0 <= row < len(old) else None
 
-        for i, t in enumerate(self.tools):
-            label = f"{i+1:0{digits}d} : {t.name}"
-
-            it = QtWidgets.QListWidgetItem(label)  # <-- NEW item each iteration
-            it.setData(QtCore.Qt.UserRole, t.name)
-            self.list.addItem(it)
-
-        # restore selection by name (optional)
-        if current_name:
-            for row in range(self.list.count()):
-                if self.list.item(row).data(QtCore.Qt.UserRole) == current_name:
-                    self.list.setCurrentRow(row)
-                    break
-
-        self.list.blockSignals(False)
+        self.list.setUpdatesEnabled(False)      # one paint for reset + restored selection
+        try:
+            with QtCore.QSignalBlocker(self.list.selectionModel()):
+                self.tool_model.reset(self.tools)
+                # restore selection by name (optional)
+                if current_name:
+                    for row, t in enumerate(self.tools):
+                        if t.name == current_name:
+                            self._set_current_row(row)
+                            break
+        finally:
+            self.list.setUpdatesEnabled(True)
 
 
     def _on_select(self):
         self._select_timer.start(150)
 
-    def _apply_selection(self):
-        idx = self.list.currentRow()
+    def _apply_selection(self, sync: bool = False):
+        idx = self._current_row()
         if idx < 0 or idx >= len(self.tools):
             self.form.set_tool(ToolSpec(name=""))
             self._last_applied_row = -1
@@ -1692,76 +2360,73 @@ class MainWindow(QtWidgets.QMainWindow):
         if idx == self._last_applied_row:
             return
 
-        self.list.setEnabled(False)
-        try:
-            tool = self.tools[idx]
+        tool = self.tools[idx]
+        if sync:                        # caller needs the form ready right away (shortcut run)
+            self.form.set_tool(tool)
+        else:
             # Queue the heavy rebuild to the next event-loop turn (avoids re-entrancy)
             QtCore.QTimer.singleShot(0, lambda t=tool: self.form.set_tool(t))
-            self._last_applied_row = idx
-
-            # Bold highlight for the selected one
-            for i in range(self.list.count()):
-                it = self.list.item(i)
-                f = it.font()
-                f.setBold(i == idx)
-                it.setFont(f)
-        finally:
-            # Re-enable slightly later so pending paints finish first
-            QtCore.QTimer.singleShot(120, lambda: self.list.setEnabled(True))
+        self._last_applied_row = idx
+
+        # Bold highlight for the selected one: repaints the old and new rows only
+        self.tool_model.set_bold_row(idx)
 
     
     def _add_tool(self):
         dlg = ToolEditor(self)
         if dlg.exec() == QtWidgets.QDialog.Accepted:
             t = dlg.result_tool()
-            self.tools.append(t)
-            self._reload_list()
-            self._save(silent=True)
+            self.tool_model.insert_tool(len(self.tools), t)
+            self._save_timer.start()
 
     def _edit_tool(self):
-        items = self.list.selectedItems()
-        if not items: return
-        idx = self.list.currentRow()
+        if not self.list.selectionModel().hasSelection(): return
+        idx = self._current_row()
         cur = self.tools[idx]
         
         dlg = ToolEditor(self, cur)
         if dlg.exec() == QtWidgets.QDialog.Accepted:
             self.tools[idx] = dlg.result_tool()
-            self._reload_list()
+            self.tool_model.tool_changed(idx)
             self._last_applied_row = -1            # <-- allow rebuild on same row
-            self.list.setCurrentRow(idx)
+            self._set_current_row(idx)
             # also refresh the right pane immediately so the new 'required' flags apply
             QtCore.QTimer.singleShot(0, lambda: self.form.set_tool(self.tools[idx]))
-            self._save(silent=True)
+            self._save_timer.start()
 
     def _dup_tool(self):
-        items = self.list.selectedItems()
-        if not items: return
-        idx = self.list.currentRow()
+        if not self.list.selectionModel().hasSelection(): return
+        idx = self._current_row()
         base = self.tools[idx]
         clone = ToolSpec(
             name=base.name + " (copy)",
             runner=base.runner,
             script=base.script,
-            inputs=[InputSpec(**i.__dict__) for i in base.inputs],
+            inputs=[replace(i) for i in base.inputs],   # specs are never mutated in place
             notes=base.notes
         )
-        self.tools.append(clone)
-        self._reload_list()
-        self.list.setCurrentRow(self.list.count()-1)
-        self._save(silent=True)
+        self.tool_model.insert_tool(len(self.tools), clone)
+        self._set_current_row(len(self.tools) - 1)
+        self._save_timer.start()
 
     def _del_tool(self):
-        items = self.list.selectedItems()
-        if not items: return
-        idx = self.list.currentRow()
+        if not self.list.selectionModel().hasSelection(): return
+        idx = self._current_row()
         name = self.tools[idx].name
         if QtWidgets.QMessageBox.question(self, "Delete", f"Delete tool '{name}'?") == QtWidgets.QMessageBox.Yes:
-            del self.tools[idx]
-            self._reload_list()
-            self._save(silent=True)
+            # like the old rebuild: nothing is selected afterwards and no rebuild fires
+            sel = self.list.selectionModel()
+            with QtCore.QSignalBlocker(sel):
+                self.tool_model.remove_tool(idx)
+                sel.clear()
+            if self._last_applied_row == idx:
+                self._last_applied_row = -1
+            elif self._last_applied_row > idx:
+                self._last_applied_row -= 1
+            self._save_timer.start()
 
     def _save(self, silent=False):
+        self._save_timer.stop()         # this write covers any pending debounced save
         save_config(CONFIG_FILE, self.tools)
         if not silent:
             QtWidgets.QMessageBox.information(self, "Saved", f"Saved to {CONFIG_FILE}")
@@ -1776,20 +2441,23 @@ class MainWindow(QtWidgets.QMainWindow):
 
         try:
             # Validate JSON first so we don't clobber current file with bad data
-            with open(fn, "r", encoding="utf-8") as f:
-                data = json.load(f)
-            if not isinstance(data, list):
+            with open(fn, "rb") as f:
+                data = f.read()
+            raw = _json_loads(data)
+            if not isinstance(raw, list):
                 raise ValueError("Config must be a JSON array of tools.")
+            tools = _tools_from_json(raw)
 
-            # Overwrite the active config file directly
-            with open(CONFIG_FILE, "w", encoding="utf-8") as out:
-                json.dump(data, out, indent=2, ensure_ascii=False)
+            # Overwrite the active config file with the picked file's bytes (no re-encode)
+            self._save_timer.stop()
+            _write_atomic(CONFIG_FILE, data)
+            _remember_config(CONFIG_FILE, data)
 
-            # Reload into the app
-            self.tools = load_config(CONFIG_FILE)
+            # Reload into the app from the already-parsed data
+            self.tools = tools
             self._reload_list()
-            if self.list.count() > 0:
-                self.list.setCurrentRow(0)
+            if self.tools:
+                self._set_current_row(0)
 
             QtWidgets.QMessageBox.information(
                 self, "Config Loaded",
@@ -1806,23 +2474,12 @@ class MainWindow(QtWidgets.QMainWindow):
         if not app:
             return
 
-        apply_modern_theme(app, mode)
-        app.setStyle("Fusion")  # stable base
-
-        style = app.style()
-        for w in app.allWidgets():
-            style.unpolish(w)
-            style.polish(w)
-            # ---- SAFE refresh that avoids QListWidget.update(index) overload
-            if isinstance(w, QtWidgets.QAbstractItemView):
-                # views repaint their viewport
-                w.viewport().update()
-            else:
-                try:
-                    QtWidgets.QWidget.update(w)  # call QWidget::update explicitly
-                except TypeError:
-                    w.repaint()  # final fallback
+        apply_modern_theme(app, mode)   # also makes sure the Fusion base style is active
+        _ICON_CACHE.clear()     # palette changed; icons are fetched again on next use
 
+        # setStyleSheet/setPalette already repolish styled widgets; only the
+        # toolbars carry their own dark/light sheet
+        self.ensurePolished()
         dark = is_dark_palette(app.palette())   # helper you already have
         for tb in self.findChildren(QtWidgets.QToolBar):
             style_toolbar(tb, dark)             # uses your dark/light CSS
@@ -1833,71 +2490,15 @@ class MainWindow(QtWidgets.QMainWindow):
 
 
 # --- Modern theme (light/dark) helpers ---
-def apply_modern_theme(app: QtWidgets.QApplication, mode: str = "light"):
-    """
-    mode: 'light' | 'dark' | 'auto'
-    """
-    if mode == "auto":
-        # follow Windows setting if available; fallback to light
-        mode = "dark" if QtGui.QGuiApplication.palette().color(QtGui.QPalette.Window).value() < 128 else "light"
+_QSS_COMMENT_RE = re.compile(r"/\*.*?\*/", re.S)
+_QSS_SPACE_RE = re.compile(r"\s+")
 
-    app.setStyle("Fusion")  # stable + themeable
-
-    # Typography
-    base = app.font()
-    base.setFamily("Segoe UI")
-    base.setPointSize(11)       # comfortable default
-    app.setFont(base)
+def _minify_qss(css: str) -> str:
+    """Drop comments and collapse whitespace so Qt tokenizes a shorter sheet."""
+    return _QSS_SPACE_RE.sub(" ", _QSS_COMMENT_RE.sub("", css)).strip()
 
-    pal = QtGui.QPalette()
-
-    if mode == "dark":
-        # Windows 11-ish dark palette
-        bg   = QtGui.QColor(32, 32, 36)
-        card = QtGui.QColor(42, 42, 48)
-        txt  = QtGui.QColor(230, 230, 235)
-        sub  = QtGui.QColor(180, 182, 188)
-        acc  = QtGui.QColor("#ADE4F7")  # primary accent (Win11 blue-ish)
-
-        pal.setColor(QtGui.QPalette.Window, bg)
-        pal.setColor(QtGui.QPalette.Base, card)
-        pal.setColor(QtGui.QPalette.AlternateBase, bg.darker(110))
-        pal.setColor(QtGui.QPalette.ToolTipBase, card)
-        pal.setColor(QtGui.QPalette.ToolTipText, txt)
-        pal.setColor(QtGui.QPalette.Text, txt)
-        pal.setColor(QtGui.QPalette.Button, card)
-        pal.setColor(QtGui.QPalette.ButtonText, txt)
-        pal.setColor(QtGui.QPalette.Highlight, acc)
-        pal.setColor(QtGui.QPalette.HighlightedText, QtCore.Qt.black)
-        pal.setColor(QtGui.QPalette.PlaceholderText, sub)
-        pal.setColor(QtGui.QPalette.WindowText, txt)
-    else:
-        # Light palette
-        bg   = QtGui.QColor(246, 246, 248)
-        card = QtGui.QColor(255, 255, 255)
-        txt  = QtGui.QColor(24, 24, 28)
-        sub  = QtGui.QColor(110, 113, 120)
-        acc  = QtGui.QColor("#ADE4F7")
-
-        pal.setColor(QtGui.QPalette.Window, bg)
-        pal.setColor(QtGui.QPalette.Base, QtGui.QColor(250, 250, 251))
-        pal.setColor(QtGui.QPalette.AlternateBase, QtGui.QColor(244, 244, 246))
-        pal.setColor(QtGui.QPalette.ToolTipBase, card)
-        pal.setColor(QtGui.QPalette.ToolTipText, txt)
-        pal.setColor(QtGui.QPalette.Text, txt)
-        pal.setColor(QtGui.QPalette.Button, card)
-        pal.setColor(QtGui.QPalette.ButtonText, txt)
-        pal.setColor(QtGui.QPalette.Highlight, acc)
-        pal.setColor(QtGui.QPalette.HighlightedText, QtCore.Qt.black)
-        pal.setColor(QtGui.QPalette.PlaceholderText, sub)
-        pal.setColor(QtGui.QPalette.WindowText, txt)
-        
-        
-
-    app.setPalette(pal)
-
-    # Global stylesheet (rounded corners, card group boxes, nicer fields & buttons)
-    app.setStyleSheet("""
+# Global stylesheet (rounded corners, card group boxes, nicer fields & buttons)
+APP_QSS = """
         /* Headings */
         QLabel#Heading {
             font-size: 18px;
@@ -1906,19 +2507,19 @@ def apply_modern_theme(app: QtWidgets.QApplication, mode: str = "light"):
         }
 
         /* Left tool list */
-        QListWidget {
+        QListView#ToolList {
             border: none;
-            padding: 8px;
+            padding: 4px 6px;                   /* the generic QListView rule below used to win */
             outline: none;
             background-color: #80BEE8F7 ;        /* #80BEE8F7  transparent with slight tint blue */
         }
-        QListWidget::item {
-            padding: 8px 10px;
+        QListView#ToolList::item {
+            padding: 4px 6px;
             border-radius: 8px;
             margin: 2px 0;
             background-color: #33BEE8F7;        /*  #33BEE8F7  transparent with slight tint blue */
         }
-        QListWidget::item:selected {
+        QListView#ToolList::item:selected {
             background: #ADE4F7;
             color: black;
         }
@@ -2075,10 +2676,9 @@ def apply_modern_theme(app: QtWidgets.QApplication, mode: str = "light"):
         }
 
         
-    """)
+    """
 
-    
-    popup_css = """
+POPUP_QSS = """
         /* ===== Popups (unified light blue look) ===== */
         QMessageBox, QInputDialog, QColorDialog, QFontDialog, QFileDialog {
             background: #ffffff;
@@ -2134,8 +2734,76 @@ def apply_modern_theme(app: QtWidgets.QApplication, mode: str = "light"):
             color: #111827;
         }
         """
-        # Append to the existing global stylesheet (don’t overwrite it)
-    app.setStyleSheet(app.styleSheet() + popup_css)
+
+THEME_QSS = _minify_qss(APP_QSS + POPUP_QSS)    # minified once at import
+
+def apply_modern_theme(app: QtWidgets.QApplication, mode: str = "light"):
+    """
+    mode: 'light' | 'dark' | 'auto'
+    """
+    if mode == "auto":
+        # follow Windows setting if available; fallback to light
+        mode = "dark" if QtGui.QGuiApplication.palette().color(QtGui.QPalette.Window).value() < 128 else "light"
+
+    # stable + themeable; setStyle re-polishes every widget, so only when not already Fusion
+    if app.style().objectName().lower() != "fusion":
+        app.setStyle("Fusion")
+
+    # Typography
+    base = app.font()
+    base.setFamily("Segoe UI")
+    base.setPointSize(11)       # comfortable default
+    app.setFont(base)
+
+    pal = QtGui.QPalette()
+
+    if mode == "dark":
+        # Windows 11-ish dark palette
+        bg   = QtGui.QColor(32, 32, 36)
+        card = QtGui.QColor(42, 42, 48)
+        txt  = QtGui.QColor(230, 230, 235)
+        sub  = QtGui.QColor(180, 182, 188)
+        acc  = QtGui.QColor("#ADE4F7")  # primary accent (Win11 blue-ish)
+
+        pal.setColor(QtGui.QPalette.Window, bg)
+        pal.setColor(QtGui.QPalette.Base, card)
+        pal.setColor(QtGui.QPalette.AlternateBase, bg.darker(110))
+        pal.setColor(QtGui.QPalette.ToolTipBase, card)
+        pal.setColor(QtGui.QPalette.ToolTipText, txt)
+        pal.setColor(QtGui.QPalette.Text, txt)
+        pal.setColor(QtGui.QPalette.Button, card)
+        pal.setColor(QtGui.QPalette.ButtonText, txt)
+        pal.setColor(QtGui.QPalette.Highlight, acc)
+        pal.setColor(QtGui.QPalette.HighlightedText, QtCore.Qt.black)
+        pal.setColor(QtGui.QPalette.PlaceholderText, sub)
+        pal.setColor(QtGui.QPalette.WindowText, txt)
+    else:
+        # Light palette
+        bg   = QtGui.QColor(246, 246, 248)
+        card = QtGui.QColor(255, 255, 255)
+        txt  = QtGui.QColor(24, 24, 28)
+        sub  = QtGui.QColor(110, 113, 120)
+        acc  = QtGui.QColor("#ADE4F7")
+
+        pal.setColor(QtGui.QPalette.Window, bg)
+        pal.setColor(QtGui.QPalette.Base, QtGui.QColor(250, 250, 251))
+        pal.setColor(QtGui.QPalette.AlternateBase, QtGui.QColor(244, 244, 246))
+        pal.setColor(QtGui.QPalette.ToolTipBase, card)
+        pal.setColor(QtGui.QPalette.ToolTipText, txt)
+        pal.setColor(QtGui.QPalette.Text, txt)
+        pal.setColor(QtGui.QPalette.Button, card)
+        pal.setColor(QtGui.QPalette.ButtonText, txt)
+        pal.setColor(QtGui.QPalette.Highlight, acc)
+        pal.setColor(QtGui.QPalette.HighlightedText, QtCore.Qt.black)
+        pal.setColor(QtGui.QPalette.PlaceholderText, sub)
+        pal.setColor(QtGui.QPalette.WindowText, txt)
+        
+        
+
+    app.setPalette(pal)
+
+    # Global stylesheet + popup look in one pass: each setStyleSheet re-polishes every widget
+    app.setStyleSheet(THEME_QSS)
 
 def is_dark_palette(pal: QtGui.QPalette) -> bool:
     bg = pal.color(QtGui.QPalette.Window)
@@ -2171,28 +2839,6 @@ def style_toolbar(tb: QtWidgets.QToolBar, dark: bool):
         """)
 
 
-def normalize_font_weights(widget: QtWidgets.QWidget):
-    """Clamp all descendant widget font weights to the valid 1..1000 range."""
-    for w in widget.findChildren(QtWidgets.QWidget):
-        f: QtGui.QFont = w.font()
-        wt = f.weight()
-        if wt < 1:
-            f.setWeight(1)
-            w.setFont(f)
-        elif wt > 1000:
-            # pick a sane, readable weight
-            f.setWeight(QtGui.QFont.Weight.DemiBold)  # 600
-            w.setFont(f)
-
-def _qt_msg_filter(mode, ctx, msg):
-    # Drop the noisy font-weight warning (harmless)
-    if 'QFont::setWeight' in msg:
-        return
-    # Forward everything else
-    sys.stderr.write(msg + '\n')
-
-QtCore.qInstallMessageHandler(_qt_msg_filter)
-
 def main():
     os.chdir(APP_DIR())
     app = QtWidgets.QApplication(sys.argv)